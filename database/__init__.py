@@ -4,10 +4,11 @@ Database package for Facebook Scraper
 Contains database operations and data models.
 """
 
-from .database import DatabaseManager
+from .database import DatabaseManager, get_database_manager
 from .models import FacebookPost
 
 __all__ = [
     "DatabaseManager",
+    "get_database_manager",
     "FacebookPost",
 ]
@@ -7,7 +7,22 @@ Handles all database operations for storing scraped posts.
 import sqlite3
 import json
 import logging
-from typing import List, Dict, Any
+import threading
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Any, Optional
+
+# Rows committed per transaction by insert_posts_batch
+DEFAULT_BATCH_SIZE = 5000
+
+# Kept as one string object so the write connection's statement cache reuses
+# the compiled statement for every batch
+_INSERT_POST_SQL = """
+    INSERT OR IGNORE INTO posts 
+    (post_id, author, content, timestamp, likes_count, comments_count,
+     shares_count, post_url, group_name, scraped_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
 
 class DatabaseManager:
@@ -16,14 +31,33 @@ class DatabaseManager:
     def __init__(self, db_path: str = "facebook_posts.db"):
         self.db_path = db_path
         self.logger = logging.getLogger(f"{__name__}.DatabaseManager")
+        # Serializes writes when one manager is shared by several scraper threads
+        self._write_lock = threading.Lock()
+        # Long-lived connection for inserts, opened on first use
+        self._write_conn: Optional[sqlite3.Connection] = None
         self._setup_database()
 
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """Open a connection tuned for WAL mode.
+
+        With WAL, synchronous=NORMAL only syncs at checkpoints instead of on
+        every commit, while staying safe against corruption. Temporary tables
+        and indices are kept in memory.
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=check_same_thread)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
     def _setup_database(self):
         """Initialize the database and create tables if they don't exist."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
 
+            # WAL lets readers and a writer work concurrently across connections
+            cursor.execute("PRAGMA journal_mode=WAL")
+
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS posts (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -49,48 +83,15 @@ class DatabaseManager:
             self.logger.error(f"Failed to setup database: {str(e)}")
             raise
 
-    def save_posts(self, posts: List[Dict[str, Any]]) -> int:
-        """Save posts to the database."""
+    def save_posts(
+        self, posts: List[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> int:
+        """Save posts to the database, committing every batch_size rows."""
         if not posts:
             return 0
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            saved_count = 0
-            for post in posts:
-                try:
-                    cursor.execute(
-                        """
-                        INSERT OR IGNORE INTO posts 
-                        (post_id, author, content, timestamp, likes_count, comments_count,
-                         shares_count, post_url, group_name, scraped_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                        (
-                            post.get("post_id"),
-                            post.get("author"),
-                            post.get("content"),
-                            post.get("timestamp"),
-                            post.get("likes_count", 0),
-                            post.get("comments_count", 0),
-                            post.get("shares_count", 0),
-                            post.get("post_url"),
-                            post.get("group_name"),
-                            post.get("scraped_at"),
-                        ),
-                    )
-                    saved_count += 1
-                except Exception as e:
-                    self.logger.error(
-                        f"Error saving post {post.get('post_id')}: {str(e)}"
-                    )
-                    continue
-
-            conn.commit()
-            conn.close()
-
+            saved_count = self.insert_posts_batch(posts, batch_size)
             self.logger.info(f"Saved {saved_count} posts to database")
             return saved_count
 
@@ -98,10 +99,69 @@ class DatabaseManager:
             self.logger.error(f"Database error: {str(e)}")
             return 0
 
+    def insert_posts_batch(
+        self, posts: List[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> int:
+        """Insert posts with executemany, committing once per chunk.
+
+        Each chunk of up to ``batch_size`` posts is one transaction, so large
+        scrapes keep near single-transaction throughput without growing the
+        WAL without bound. Posts whose post_id already exists are ignored.
+
+        Returns:
+            int: Number of rows actually inserted
+        """
+        if not posts:
+            return 0
+
+        # Rows are produced lazily as executemany consumes them
+        rows = (
+            (
+                post.get("post_id"),
+                post.get("author"),
+                post.get("content"),
+                post.get("timestamp"),
+                post.get("likes_count", 0),
+                post.get("comments_count", 0),
+                post.get("shares_count", 0),
+                post.get("post_url"),
+                post.get("group_name"),
+                post.get("scraped_at"),
+            )
+            for post in posts
+        )
+
+        inserted = 0
+        with self._write_lock:
+            conn = self._get_write_connection()
+            while True:
+                chunk = list(islice(rows, batch_size))
+                if not chunk:
+                    break
+                try:
+                    cursor = conn.executemany(_INSERT_POST_SQL, chunk)
+                    conn.commit()
+                except sqlite3.Error:
+                    conn.rollback()
+                    raise
+                inserted += cursor.rowcount
+            return inserted
+
+    def _get_write_connection(self) -> sqlite3.Connection:
+        """Return the insert connection, opening it on first use.
+
+        Reusing one connection lets sqlite3's statement cache keep the
+        compiled INSERT across batches. Callers must hold ``_write_lock``,
+        which also makes sharing it between scraper threads safe.
+        """
+        if self._write_conn is None:
+            self._write_conn = self._connect(check_same_thread=False)
+        return self._write_conn
+
     def get_posts(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """Retrieve posts from the database."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
 
             cursor.execute(
@@ -147,7 +207,7 @@ class DatabaseManager:
     ) -> List[Dict[str, Any]]:
         """Retrieve posts from a specific group."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
 
             cursor.execute(
@@ -192,7 +252,7 @@ class DatabaseManager:
     def get_post_count(self) -> int:
         """Get total number of posts in the database."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
 
             cursor.execute("SELECT COUNT(*) FROM posts")
@@ -208,7 +268,7 @@ class DatabaseManager:
     def delete_post(self, post_id: str) -> bool:
         """Delete a specific post from the database."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
 
             cursor.execute("DELETE FROM posts WHERE post_id = ?", (post_id,))
@@ -231,7 +291,7 @@ class DatabaseManager:
     def clear_database(self) -> bool:
         """Clear all posts from the database."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
 
             cursor.execute("DELETE FROM posts")
@@ -265,7 +325,7 @@ class DatabaseManager:
     def get_database_stats(self) -> Dict[str, Any]:
         """Get database statistics."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Get total post count
@@ -295,8 +355,12 @@ class DatabaseManager:
 
     def close(self):
         """Close database connections."""
-        # SQLite connections are automatically closed, but we can add cleanup here if needed
-        pass
+        # Other connections are closed after each operation; the insert
+        # connection is reopened if the manager is used again
+        with self._write_lock:
+            if self._write_conn is not None:
+                self._write_conn.close()
+                self._write_conn = None
 
     def __enter__(self):
         """Context manager entry."""
@@ -305,3 +369,13 @@ class DatabaseManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+
+@lru_cache(maxsize=None)
+def get_database_manager(db_path: str = "facebook_posts.db") -> DatabaseManager:
+    """Get the shared DatabaseManager for a database path.
+
+    Scrapers writing to the same file share one manager, so its write lock
+    serializes their inserts and the schema setup runs once per path.
+    """
+    return DatabaseManager(db_path)
@@ -9,7 +9,7 @@ from typing import Dict, Any, Optional
 from strategies.base_scraper import ScrapedContent
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FacebookPost(ScrapedContent):
     """Facebook-specific post data model."""
     # Override base class fields to make them required
@@ -206,11 +206,16 @@ def main():
             print(f"   🖼️  Screenshots captured: {len(posts)}")
 
             # Calculate total size of screenshots
-            total_size_mb = 0
+            # One stat per file; a missing screenshot simply adds nothing
+            total_size = 0
             for post in posts:
                 screenshot_path = post.get("screenshot_path")
-                if screenshot_path and os.path.exists(screenshot_path):
-                    total_size_mb += os.path.getsize(screenshot_path) / (1024 * 1024)
+                if screenshot_path:
+                    try:
+                        total_size += os.stat(screenshot_path).st_size
+                    except OSError:
+                        pass
+            total_size_mb = total_size / (1024 * 1024)
             print(f"   💾 Total size: {total_size_mb:.2f} MB")
 
             # Show comprehensive stats
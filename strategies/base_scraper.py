@@ -10,7 +10,7 @@ from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedContent:
     """Base data class for scraped content information."""
     content: str                      # Main content text
@@ -5,47 +5,441 @@ Locates Facebook posts using HTML tags and captures screenshots for OCR processi
 Also extracts text content and image information from posts.
 """
 
+import asyncio
+import itertools
+import json
 import time
+import uuid
 import os
 import random
+import re
+import sqlite3
+import tempfile
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib json module
+    orjson = None
+
+from selenium.common.exceptions import (
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
-from fake_useragent import UserAgent
+from selenium.webdriver.support.wait import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 
 from .base_scraper import BaseScraper
-from database.database import DatabaseManager
+from database.database import get_database_manager
 from utils.human_behavior import HumanBehavior
-from utils.chrome_driver_setup import ChromeDriverSetup
+from utils.chrome_driver_setup import get_chrome_driver_setup
+from utils.screenshot_writer import ScreenshotWriter
+
+# First remote debugging port handed to parallel scraper workers
+_BASE_DEBUG_PORT = 9222
+
+# Video streams and reels never appear in a still screenshot, so they are
+# blocked at the network layer instead of being downloaded while scrolling.
+# setBlockedURLs also applies to page navigations, so patterns only match
+# media file extensions and Facebook's video CDN hosts, never bare words
+# that could appear in a group URL
+_BLOCKED_MEDIA_URLS = (
+    "*.mp4*",
+    "*.m3u8*",
+    "*.webm*",
+    "*://video*.fbcdn.net/*",
+)
+
+# Elements that show a group/feed page has rendered enough to start scraping
+_FEED_READY_SELECTOR = "div[role='feed'], div[role='article']"
+
+# Elements that indicate the user is logged in, as one CSS selector list
+_LOGGED_IN_SELECTOR = ", ".join(
+    (
+        '[data-testid="blue_bar_profile_link"]',
+        '[aria-label="Your profile"]',
+        '[data-testid="pagelet_welcome_box"]',
+        '[data-testid="nav_bar_profile"]',
+    )
+)
+
+# Login form fields
+_EMAIL_LOCATOR = (By.ID, "email")
+_PASSWORD_LOCATOR = (By.ID, "pass")
+_LOGIN_BUTTON_LOCATOR = (By.NAME, "login")
+
+# Either a logged-in indicator or the login form, whichever renders first
+_LOGIN_STATE_SELECTOR = f"{_LOGGED_IN_SELECTOR}, #email"
+
+# Post containers inside the feed, matched by Facebook's feed item classes
+_POST_CONTAINER_SELECTOR = "div.x1yztbdb.x1n2onr6.xh8yej3.x1ja2u2z"
+
+# Class fragments used by Facebook post containers across UI versions
+_MODERN_POST_CLASSES = (
+    "userContentWrapper",  # Classic Facebook post wrapper
+    "du4w35lb",  # Modern Facebook post class
+    "k4urcfbm",  # Another modern post identifier
+    "l9j0dhe7",  # Post container class
+    "sjgh65i0",  # Post wrapper class
+    "xd9ej83",  # New Facebook feed post class
+    "x162z183",  # New Facebook feed post class
+    "xsag5q8",  # New Facebook feed post class
+    "xf7dkkf",  # New Facebook feed post class
+)
+
+# Any of the class fragments above, matched in one scan of the class attribute
+_MODERN_POST_CLASS_RE = re.compile("|".join(map(re.escape, _MODERN_POST_CLASSES)))
+
+# Post message content (multiple selectors for robustness)
+_POST_MESSAGE_SELECTORS = (
+    "[data-testid='post_message']",
+    "[data-testid='message']",
+    "div[data-testid='post_message']",
+    "div[data-testid='message']",
+)
+
+# Author information
+_AUTHOR_SELECTORS = (
+    "h3 a",
+    "a[class*='x1i10hfl']",
+    "[data-testid='post_author']",
+    "[data-testid='author']",
+    "[data-testid='user_name']",
+    "a[href*='/profile.php']",
+    "a[href*='/']",
+)
+
+# Comments, replies and other UI elements that are not posts
+_NON_POST_INDICATORS = (
+    "[data-testid='comment']",
+    "[data-testid='reply']",
+    "[data-testid='comment_reply']",
+    "div[aria-label*='comment']",
+    "div[aria-label*='reply']",
+    "[data-testid='UFI2Comment']",
+    "[data-testid='UFI2Reply']",
+)
+
+# Engagement elements (likes, comments, shares)
+_ENGAGEMENT_SELECTORS = (
+    "[data-testid='UFI2ReactionsCount']",
+    "[data-testid='UFI2CommentsCount']",
+    "[data-testid='UFI2SharesCount']",
+    "[aria-label*='reaction']",
+    "[aria-label*='comment']",
+    "[aria-label*='share']",
+)
+
+# Key elements that indicate a post container has finished loading
+_LOADED_MARKER_SELECTOR = ", ".join(
+    (
+        "[data-testid='post_message']",  # Post content
+        "[data-testid='message']",  # Alternative post content
+        "h3 a",  # Author name
+        "a[class*='x1i10hfl']",  # Author link
+        "[data-testid='post_author']",  # Author
+        "[data-testid='author']",  # Alternative author
+    )
+)
+
+# Each selector group combined into one CSS selector list, so a single
+# lookup answers "does any of them match"
+_POST_MESSAGE_SELECTOR = ", ".join(_POST_MESSAGE_SELECTORS)
+_AUTHOR_SELECTOR = ", ".join(_AUTHOR_SELECTORS)
+_NON_POST_SELECTOR = ", ".join(_NON_POST_INDICATORS)
+_ENGAGEMENT_SELECTOR = ", ".join(_ENGAGEMENT_SELECTORS)
+
+# Attributes and selector checks needed to validate one post container,
+# used by the whole-feed lookup below
+_POST_METADATA_JS_FN = """
+function postMetadata(e, messageSel, authorSel, nonPostSel, engagementSel) {
+    return {
+        role: e.getAttribute('role'),
+        testid: e.getAttribute('data-testid'),
+        class: e.getAttribute('class'),
+        has_message: !!e.querySelector(messageSel),
+        has_author: !!e.querySelector(authorSel),
+        is_comment: !!e.querySelector(nonPostSel),
+        has_engagement: !!e.querySelector(engagementSel),
+    };
+}
+"""
+
+# Collect every feed post container together with the attributes needed to
+# validate it, so a whole scroll batch costs one WebDriver round-trip instead
+# of ~25 per container. Returns null when the feed is not on the page.
+_CONTAINER_METADATA_JS = _POST_METADATA_JS_FN + """
+const [containerSel, ...selectors] = arguments;
+const feed = document.querySelector("div[role='feed']");
+if (!feed) return null;
+return Array.from(feed.querySelectorAll(containerSel)).map(e => ({
+    element: e,
+    key: e.getAttribute('id')
+        || e.querySelector("a[href*='/posts/'], a[href*='/permalink/']")?.href
+        || e.innerText.slice(0, 64),
+    ...postMetadata(e, ...selectors),
+}));
+"""
+
+# Expandable "See more" buttons inside a post container
+_EXPAND_BUTTON_SELECTORS = (
+    # Facebook's "See more" button with full class list
+    "div.x1i10hfl.xjbqb8w.x1ejq31n.x18oe1m7.x1sy0etr.xstzfhl.x972fbf.x10w94by.x1qhh985.x14e42zd.x9f619.x1ypdohk.xt0psk2.x3ct3a4.xdj266r.x14z9mp.xat24cr.x1lziwak.xexx8yu.xyri2b.x18d9i69.x1c1uobl.x16tdsg8.x1hl2dhg.xggy1nq.x1a2a7pz.xkrqix3.x1sur9pj.xzsf02u.x1s688f[role='button']",
+    # # Partial class match for "See more" button (more flexible)
+    # "div[class*='x1i10hfl'][class*='x1ypdohk'][role='button']",
+)
+_EXPAND_BUTTON_SELECTOR = ", ".join(_EXPAND_BUTTON_SELECTORS)
+
+# First visible, enabled descendant matching a selector together with its
+# label, or null, so picking a button costs one round-trip instead of two per
+# candidate plus two more for the label
+_FIRST_CLICKABLE_JS = """
+const button = Array.from(arguments[0].querySelectorAll(arguments[1])).find(e =>
+    e.getClientRects().length > 0
+    && getComputedStyle(e).visibility !== 'hidden'
+    && !e.disabled
+    && e.getAttribute('aria-disabled') !== 'true'
+);
+if (!button) return null;
+return {element: button, label: button.innerText || button.getAttribute('aria-label')};
+"""
+
+# Whether any descendant matching a selector is rendered and visible, checked
+# in the page instead of one is_displayed() round-trip per element
+_HAS_VISIBLE_MATCH_JS = """
+return Array.from(arguments[0].querySelectorAll(arguments[1])).some(e =>
+    e.getClientRects().length > 0
+    && getComputedStyle(e).visibility !== 'hidden'
+);
+"""
+
+# Page-coordinate clip rectangle of an element, for CDP Page.captureScreenshot
+_ELEMENT_CLIP_JS = """
+const r = arguments[0].getBoundingClientRect();
+return {
+    x: r.left + window.scrollX,
+    y: r.top + window.scrollY,
+    width: r.width,
+    height: r.height,
+    scale: 1,
+};
+"""
+
+# Viewport height and the viewport-relative bottom edge of each feed post
+# container, used to size the next scroll step
+_SCROLL_LAYOUT_JS = """
+return {
+    viewportH: window.innerHeight,
+    bottoms: Array.from(document.querySelectorAll(arguments[0]))
+        .map(e => e.getBoundingClientRect().bottom),
+};
+"""
+
+# Screenshot formats supported by CDP Page.captureScreenshot -> file extension
+_IMAGE_EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+
+# Buffer size for output files, large enough to hold a typical export in one write
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Post fields copied into the detailed JSON export, with their defaults
+_POST_COPY_KEYS = (
+    ("post_id", "unknown"),
+    ("scraped_at", ""),
+    ("screenshot_path", ""),
+    ("is_valid_post", False),
+    ("container_info", {}),
+)
+
+# Post text selectors, most specific first
+_POST_TEXT_SELECTORS = (
+    "div.xdj266r.x14z9mp.xat24cr.x1lziwak.x1vvkbs.x126k92a",  # From post_example.py
+    "div[data-testid='post_message']",  # Fallback
+    "div[data-testid='message']",  # Alternative fallback
+)
+
+# Image container selectors
+_IMAGE_CONTAINER_SELECTORS = (
+    "div.x1i10hfl.xjbqb8w.x1ejq31n.x13faqbe.x1vvkbs.x126k92a.x193iq5w",  # From post_example.py
+    "div.x17z8epw.x579bpy.x1s688f.x2b8uid",  # Image remaining class
+    "img[src*='scontent']",  # Facebook image URLs
+    "img[data-visualcompletion='media-vc-image']",  # Facebook image attribute
+)
+
+# Clickable image link selectors
+_IMAGE_LINK_SELECTORS = (
+    "a[class*='x1i10hfl'][class*='x1qjc9v5'][role='link']",  # From post_example.py (partial)
+    "a[href*='photo']",  # Facebook photo links
+    "a[href*='story_fbid']",  # Facebook story links
+)
+
+_IMAGE_CONTAINER_SELECTOR = ", ".join(_IMAGE_CONTAINER_SELECTORS)
+_IMAGE_LINK_SELECTOR = ", ".join(_IMAGE_LINK_SELECTORS)
+
+# Post text plus visible Facebook CDN images and photo/story links of a post
+# container, gathered in one in-page pass so content extraction costs a single
+# round-trip. Text comes from the first visible element with non-empty text,
+# trying the text selectors in priority order. Links are deduplicated by href.
+_POST_CONTENT_JS = """
+const [container, textSelectors, imageSel, linkSel] = arguments;
+const visible = e => e.getClientRects().length > 0
+    && getComputedStyle(e).visibility !== 'hidden';
+let text = null;
+for (const selector of textSelectors) {
+    for (const e of container.querySelectorAll(selector)) {
+        if (!visible(e)) continue;
+        text = (e.innerText || '').trim() || null;
+        if (text) break;
+    }
+    if (text) break;
+}
+const images = [];
+for (const e of container.querySelectorAll(imageSel)) {
+    const src = e.src || e.getAttribute('src');
+    if (!visible(e) || !src || !src.includes('scontent')) continue;
+    images.push({
+        src: src,
+        alt: e.getAttribute('alt') || 'No alt text',
+        title: e.getAttribute('title') || 'No title',
+        class: e.getAttribute('class') || 'unknown',
+    });
+}
+const links = [];
+const seen = new Set();
+for (const e of container.querySelectorAll(linkSel)) {
+    const href = e.href || e.getAttribute('href');
+    if (!visible(e) || !href || seen.has(href)) continue;
+    if (!href.includes('photo') && !href.includes('story_fbid')) continue;
+    seen.add(href);
+    links.push({
+        href: href,
+        text: (e.innerText || '').trim(),
+        aria_label: e.getAttribute('aria-label') || '',
+        class: e.getAttribute('class') || 'unknown',
+    });
+}
+return {text: text, images: images, links: links};
+"""
+
+
+def _json_default(obj: Any) -> str:
+    """Serialize values the JSON encoder does not support natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _dumps_json(data: Any, pretty: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON, using orjson when installed.
+
+    Output is compact unless ``pretty`` is set, in which case it is indented
+    by two spaces. orjson encodes datetime objects natively (same ISO 8601
+    output as ``datetime.isoformat()``), so ``default`` only runs for unknown
+    types.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(data, default=str, option=option)
+    if pretty:
+        return json.dumps(
+            data, indent=2, ensure_ascii=False, default=_json_default
+        ).encode("utf-8")
+    return json.dumps(
+        data, separators=(",", ":"), ensure_ascii=False, default=_json_default
+    ).encode("utf-8")
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class FacebookUIScraper(BaseScraper):
     """Facebook scraper that locates posts using HTML tags and captures screenshots for OCR processing."""
 
-    def __init__(self, db_path: str = "facebook_posts.db", validate_posts: bool = True):
+    def __init__(
+        self,
+        db_path: str = "facebook_posts.db",
+        validate_posts: bool = True,
+        image_format: str = "webp",
+        image_quality: int = 85,
+        screenshot_dir: str = "facebook_screenshots",
+        profile_dir: Optional[str] = None,
+        debug_port: Optional[int] = None,
+        block_media: bool = True,
+        cookies_path: Optional[str] = None,
+    ):
+        """Create the scraper.
+
+        Screenshots are encoded as WebP at quality 85 by default: for OCR
+        input this is visually lossless for text, several times smaller than
+        PNG and cheaper for Chrome to encode. OCR tools that load images via
+        Pillow (Tesseract, PaddleOCR) read WebP and JPEG transparently. Pass
+        ``image_format="png"`` for lossless output, or ``"jpeg"``.
+
+        ``profile_dir`` and ``debug_port`` give this instance its own Chrome
+        profile and debugging port so several scrapers can run side by side.
+        ``block_media`` stops Chrome from downloading video while scrolling.
+        Session cookies are saved to ``cookies_path`` after a login (by default
+        ``cookies.json`` in the profile directory) and restored into fresh
+        browsers, so they start out logged in.
+        """
+        if image_format not in _IMAGE_EXTENSIONS:
+            raise ValueError(
+                f"Unsupported image format {image_format!r}, expected one of "
+                f"{', '.join(_IMAGE_EXTENSIONS)}"
+            )
         super().__init__(name="FacebookUIScraper")
-        self.db_manager = DatabaseManager(db_path)
+        self.db_manager = get_database_manager(db_path)
         self.driver = None
-        self.screenshot_dir = "facebook_screenshots"
+        self.screenshot_dir = screenshot_dir
+        self.profile_dir = profile_dir
+        self.debug_port = debug_port
+        self.block_media = block_media
+        if cookies_path is None:
+            cookies_path = (
+                os.path.join(profile_dir, "cookies.json")
+                if profile_dir
+                else "facebook_cookies.json"
+            )
+        self.cookies_path = cookies_path
+        self._cookies_restored = False
         self.is_authenticated = False
-        self.ua = UserAgent()
         self.human_behavior = HumanBehavior()
         self.validate_posts = validate_posts  # Switch to enable/disable post validation
+        self.image_format = image_format
+        self.image_quality = image_quality
+
+        # Screenshot filenames share one session tag plus a running counter.
+        # The random suffix keeps them (and the post_id derived from them)
+        # unique across parallel workers started in the same second.
+        self._session_ts = (
+            f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        )
+        self._capture_counter = itertools.count(1)
+
+        # Background writer so disk I/O overlaps with the next Selenium command
+        self._screenshot_writer = ScreenshotWriter(logger=self.logger)
         
-        # Create screenshot directory
-        if not os.path.exists(self.screenshot_dir):
-            os.makedirs(self.screenshot_dir)
+        # Create screenshot directory; screenshot paths are this prefix plus the filename
+        Path(self.screenshot_dir).mkdir(parents=True, exist_ok=True)
+        self._screenshot_prefix = os.path.join(self.screenshot_dir, "")
 
     def setup_driver(self, headless: bool = True) -> bool:
         """Setup Chrome WebDriver with human behavior enhancements and profile management."""
         try:
-            # Create Chrome driver setup instance
-            chrome_setup = ChromeDriverSetup()
+            # Shared Chrome driver setup instance
+            chrome_setup = get_chrome_driver_setup()
             
-            # Check profile status first
-            profile_info = chrome_setup.check_profile_status()
-            self.logger.info(f"Profile Status: {profile_info['profile_status']}")
+            # Check profile status first; a dedicated profile needs no lookup
+            if not self.profile_dir:
+                profile_info = chrome_setup.check_profile_status()
+                self.logger.info(f"Profile Status: {profile_info['profile_status']}")
             
             # Define enhancement function for human behavior
             def enhance_options(options):
@@ -53,9 +447,20 @@ class FacebookUIScraper(BaseScraper):
             
             # Setup driver with fallback options and profile management
             self.driver = chrome_setup.setup_driver(
-                headless=headless, enhance_options=enhance_options
+                headless=headless,
+                enhance_options=enhance_options,
+                profile_dir=self.profile_dir,
+                debug_port=self.debug_port,
             )
             
+            self.logger.debug(
+                "ChromeDriver keep-alive: %s",
+                getattr(self.driver.command_executor, "keep_alive", None),
+            )
+
+            if self.block_media:
+                self._block_media_requests()
+
             # Set driver in human behavior module
             self.human_behavior.set_driver(self.driver)
             
@@ -74,6 +479,17 @@ class FacebookUIScraper(BaseScraper):
             self.logger.error(f"Failed to setup driver: {str(e)}")
             return False
 
+    def _block_media_requests(self) -> None:
+        """Block video downloads through CDP; images are already disabled by the profile prefs."""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": list(_BLOCKED_MEDIA_URLS)}
+            )
+            self.logger.info("🚫 Blocking video requests while scraping")
+        except WebDriverException as e:
+            self.logger.warning(f"Failed to block media requests: {str(e)}")
+
     def authenticate(self, credentials: Dict[str, str]) -> bool:
         """Authenticate with Facebook using provided credentials or existing profile session."""
         try:
@@ -83,10 +499,17 @@ class FacebookUIScraper(BaseScraper):
                 )
                 return False
 
-            # First, check if already logged in from profile
+            # Saved cookies are verified on the target page by scrape_posts,
+            # which saves loading the homepage just to check the session
             self.logger.info("🔍 Checking for existing Facebook session...")
+            if self._restore_cookies():
+                self.logger.info("✅ Restored Facebook session from saved cookies!")
+                return True
+
+            # Otherwise check if already logged in from the profile
             if self._check_if_already_logged_in():
                 self.logger.info("✅ Already authenticated with Facebook from profile!")
+                self._save_cookies()
                 self.logger.info(
                     "🔐 Your session is persistent - no need to login again!"
                 )
@@ -101,34 +524,36 @@ class FacebookUIScraper(BaseScraper):
                 self.logger.error("Email and password are required for authentication")
                 return False
 
-            # Navigate to Facebook login page
+            # Navigate to Facebook login page and wait for the form to render
             self.driver.get("https://www.facebook.com/login")
-            self.human_behavior.random_delay(2, 4)
+            self._wait_for(EC.presence_of_element_located(_EMAIL_LOCATOR), 10)
 
             # Find and fill email field with human-like behavior
-            email_field = self.driver.find_element(By.ID, "email")
+            email_field = self.driver.find_element(*_EMAIL_LOCATOR)
             self.human_behavior.human_fill_form(email_field, email)
 
             # Pause before moving to password field
             self.human_behavior.random_delay(1, 2)
 
             # Find and fill password field with human-like behavior
-            password_field = self.driver.find_element(By.ID, "pass")
+            password_field = self.driver.find_element(*_PASSWORD_LOCATOR)
             self.human_behavior.human_fill_form(password_field, password)
 
             # Pause before clicking login
             self.human_behavior.random_delay(1, 2)
 
             # Click login button with human-like behavior
-            login_button = self.driver.find_element(By.NAME, "login")
+            login_button = self.driver.find_element(*_LOGIN_BUTTON_LOCATOR)
+            login_url = self.driver.current_url
             self.human_behavior.human_click(login_button)
 
-            # Wait for login to complete with human-like patience
-            self.human_behavior.random_delay(4, 7)
+            # Wait for the post-login redirect instead of a fixed delay
+            self._wait_for(EC.url_changes(login_url), 10)
 
             # Check if login was successful
             if "login" not in self.driver.current_url:
                 self.logger.info("✅ Login successful!")
+                self._save_cookies()
                 self.logger.info("💾 Your session has been saved to the profile!")
                 self.logger.info(
                     "🔐 Next time you run the scraper, you'll be automatically logged in!"
@@ -143,48 +568,104 @@ class FacebookUIScraper(BaseScraper):
             self.logger.error(f"Login failed: {str(e)}")
             return False
 
-    def _check_if_already_logged_in(self) -> bool:
-        """Check if the user is already logged into Facebook."""
+    def _save_cookies(self) -> None:
+        """Snapshot the browser's cookies so later sessions can skip the login."""
+        tmp_path = None
+        try:
+            data = _dumps_json(self.driver.get_cookies())
+
+            # Parallel workers share cookies_path, so write a private temp file
+            # and swap it in atomically; readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.cookies_path)),
+                prefix=".cookies-",
+                suffix=".tmp",
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.cookies_path)
+            tmp_path = None
+            self.logger.info(f"🍪 Saved session cookies to {self.cookies_path}")
+        except (OSError, WebDriverException) as e:
+            self.logger.warning(f"Failed to save session cookies: {str(e)}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def _restore_cookies(self) -> bool:
+        """Load saved session cookies into the browser, once per scraper.
+
+        Cookies can only be set for the current domain, so this first loads
+        a lightweight Facebook resource instead of a full page.
+
+        Returns:
+            bool: True if cookies were restored
+        """
+        if self._cookies_restored or not os.path.exists(self.cookies_path):
+            return False
+        self._cookies_restored = True
+
+        try:
+            with open(self.cookies_path, "rb") as f:
+                cookies = _loads_json(f.read())
+
+            self.driver.get("https://www.facebook.com/favicon.ico")
+            for cookie in cookies:
+                try:
+                    self.driver.add_cookie(cookie)
+                except WebDriverException as e:
+                    self.logger.debug("Skipping cookie %s: %s", cookie.get("name"), e)
+
+            self.logger.info(f"🍪 Restored session cookies from {self.cookies_path}")
+            return True
+        except (OSError, ValueError, WebDriverException) as e:
+            self.logger.warning(f"Failed to restore session cookies: {str(e)}")
+            return False
+
+    def _check_if_already_logged_in(self, preserve_url: Optional[str] = None) -> bool:
+        """Check if the user is already logged into Facebook.
+
+        If the browser is already on ``preserve_url``, the check runs against
+        the current page instead of navigating to the Facebook homepage.
+        """
         try:
             if not self.driver:
                 return False
 
             # Navigate to Facebook homepage to check login status
-            self.driver.get("https://www.facebook.com")
-            time.sleep(2)
+            if not (preserve_url and self.driver.current_url.startswith(preserve_url)):
+                self.driver.get("https://www.facebook.com")
+
+            # Proceed as soon as either a logged-in indicator or the login form renders
+            self._wait_for(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _LOGIN_STATE_SELECTOR)),
+                5,
+                poll_frequency=0.2,
+            )
 
             # Check for elements that indicate user is logged in
-            logged_in_indicators = [
-                '[data-testid="blue_bar_profile_link"]',
-                '[aria-label="Your profile"]',
-                '[data-testid="pagelet_welcome_box"]',
-                '[data-testid="nav_bar_profile"]',
-            ]
-
-            for selector in logged_in_indicators:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if element.is_displayed():
-                        self.logger.info("Found logged-in indicator: " + selector)
-                        return True
-                except Exception:
-                    continue
+            indicators = self.driver.find_elements(By.CSS_SELECTOR, _LOGGED_IN_SELECTOR)
+            if any(element.is_displayed() for element in indicators):
+                self.logger.info("Found logged-in indicator")
+                return True
 
             # Also check if we're redirected away from login page
             if (
                 "login" not in self.driver.current_url
                 and "facebook.com" in self.driver.current_url
             ):
-                try:
-                    login_form = self.driver.find_element(By.ID, "email")
-                    if not login_form.is_displayed():
-                        self.logger.info(
-                            "No login form visible, likely already logged in"
-                        )
-                        return True
-                except Exception:
+                login_forms = self.driver.find_elements(*_EMAIL_LOCATOR)
+                if not login_forms:
                     self.logger.info("No login form found, likely already logged in")
                     return True
+                if not login_forms[0].is_displayed():
+                    self.logger.info(
+                        "No login form visible, likely already logged in"
+                    )
+                    return True
 
             return False
 
@@ -201,22 +682,30 @@ class FacebookUIScraper(BaseScraper):
                 self.logger.error("WebDriver not initialized")
                 return []
 
+            # Start from saved session cookies when the browser has none yet
+            if not self.is_authenticated:
+                self._restore_cookies()
+
             # Navigate to the target URL
             self.logger.info(f"🌐 Navigating to: {target_url}")
             self.driver.get(target_url)
-            self.human_behavior.random_delay(3, 5)  # Wait for page to load
+            self._wait_for_feed()
 
             # Check if we need to login
             if not self.is_authenticated:
                 self.logger.info("🔐 Authentication required...")
-                if not self._check_if_already_logged_in():
+                current_url = self.driver.current_url
+                if not self._check_if_already_logged_in(preserve_url=target_url):
                     self.logger.error("❌ Not logged in and no credentials provided")
                     return []
                 else:
                     self.logger.info("✅ Already logged in, proceeding...")
-                    # Navigate back to target URL after login check
-                    self.driver.get(target_url)
-                    self.human_behavior.random_delay(3, 5)
+                    self.is_authenticated = True
+                    self._save_cookies()
+                    # Navigate back to target URL only if the check left the page
+                    if self.driver.current_url != current_url:
+                        self.driver.get(target_url)
+                        self._wait_for_feed()
 
             # Start the scroll-find-capture process
             self.logger.info(
@@ -227,142 +716,101 @@ class FacebookUIScraper(BaseScraper):
             posts = []
             scroll_attempts = 0
             max_scroll_attempts = 10
+            # Stable keys of containers already handled, so each scroll only
+            # processes newly loaded posts
+            seen_keys = set()
+            if self.validate_posts:
+                self.logger.info("🧐 Validating posts")
+            else:
+                # Validation disabled: treat all containers as valid posts
+                self.logger.info("🧐❌ Validating post disable")
+
+            # Stop early once scrolling stops loading new containers (end of feed)
+            previous_count = -1
+            unchanged_scrolls = 0
 
             while len(posts) < max_posts and scroll_attempts < max_scroll_attempts:
                 # Find post containers in current view using Facebook's actual feed structure
-                post_containers = []
-
-                try:
-                    # First try to find the feed container
-                    feed_container = self.driver.find_element(
-                        By.CSS_SELECTOR, "div[role='feed']"
-                    )
-
-                    # Then find posts within the feed using the specific class combination
-                    post_containers = feed_container.find_elements(
-                        By.CSS_SELECTOR, "div.x1yztbdb.x1n2onr6.xh8yej3.x1ja2u2z"
-                    )
-
-                    if post_containers:
-                        self.logger.info("✅ Found posts using Facebook feed structure")
-                    else:
-                        self.logger.info(
-                            "Feed found but no posts with expected classes"
-                        )
+                container_metadata = self._fetch_container_metadata()
 
-                except Exception as e:
-                    self.logger.debug(f"Feed structure not found: {str(e)}")
+                if len(container_metadata) == previous_count:
+                    unchanged_scrolls += 1
+                    if unchanged_scrolls >= 2:
+                        self.logger.info("🛑 No new posts loaded after 2 scrolls, stopping")
+                        break
+                else:
+                    unchanged_scrolls = 0
+                previous_count = len(container_metadata)
 
                 self.logger.info(
-                    f"📱 Found {len(post_containers)} potential post containers in current view"
+                    f"📱 Found {len(container_metadata)} potential post containers in current view"
                 )
-
-                for i, container in enumerate(post_containers):
-                    if len(posts) >= max_posts:
-                        break
-
-                    try:
-                        # Get container info for logging
-                        role = container.get_attribute("role") or "no-role"
-                        data_testid = (
-                            container.get_attribute("data-testid") or "no-testid"
+                # Posts captured in this scroll pass, written to the database together
+                pending_posts = []
+
+                # Filter pass: skip containers handled in earlier passes and, with
+                # validation enabled, drop non-posts before any per-container work
+                candidates = []
+                for i, meta in enumerate(container_metadata):
+                    key = meta["key"]
+                    if key and key in seen_keys:
+                        continue
+                    if self.validate_posts and not self._is_actual_post_from_meta(meta):
+                        # Invalid post - skip screenshot. A post whose message or
+                        # author has not rendered yet is checked again on the next
+                        # pass with fresh metadata instead of being dropped for good
+                        if meta["has_message"] and meta["has_author"]:
+                            seen_keys.add(key)
+                        self.logger.info(
+                            f"ℹ️ Container {i + 1} is not a valid post (role='{meta['role'] or 'no-role'}', testid='{meta['testid'] or 'no-testid'}') - skipping screenshot"
                         )
-                        class_attr = container.get_attribute("class") or "no-class"
-
-                        # Wait for the container to be fully loaded before processing
-                        if self._wait_for_container_loaded(container):
-                            # Look for and click expandable buttons before processing
-                            self._click_expandable_buttons(container, i + 1)
-                            
-                            # Extract content data after clicking expand buttons
-                            content_data = self.extract_content_data(container)
-                            
-                            # Apply validation logic based on validate_posts setting
-                            if self.validate_posts:
-                                self.logger.info("🧐 Validating posts")
-                                # Validation enabled: check if it's an actual post
-                                is_valid_post = self._is_actual_post(container)
-                                
-                                if is_valid_post:
-                                    # Valid post found - capture screenshot
-                                    screenshot_path = (
-                                        self._capture_screenshot_with_wait(
-                                            container, i + 1
-                                        )
-                                    )
-
-                                    if screenshot_path:
-                                        # Create post data for valid posts
-                                        post_data = {
-                                            "post_id": f"post_{len(posts) + 1:03d}",
-                                            "screenshot_path": screenshot_path,
-                                            "scraped_at": datetime.now().isoformat(),
-                                            "is_valid_post": True,
-                                            "container_info": {
-                                                "role": role,
-                                                "data_testid": data_testid,
-                                                "class": class_attr,
-                                            },
-                                            "content_data": content_data,
-                                        }
-                                        posts.append(post_data)
-                                        self.logger.info(
-                                            f"✅ Captured VALID post {len(posts)}: {os.path.basename(screenshot_path)}"
-                                        )
-                                    else:
-                                        self.logger.warning(
-                                            f"Failed to capture screenshot for container {i + 1}"
-                                        )
-                                else:
-                                    # Invalid post - skip screenshot
-                                    self.logger.info(
-                                        f"ℹ️ Container {i + 1} is not a valid post (role='{role}', testid='{data_testid}') - skipping screenshot"
-                                    )
-                            else:
-                                self.logger.info("🧐❌ Validating post disable")
-                                # Validation disabled: treat all containers as valid posts
-                                # Skip _is_actual_post process entirely
-                                screenshot_path = self._capture_screenshot_with_wait(
-                                    container, i + 1
-                                )
-
-                                if screenshot_path:
-                                    # Create post data for all containers
-                                    post_data = {
-                                        "post_id": f"post_{len(posts) + 1:03d}",
-                                        "screenshot_path": screenshot_path,
-                                        "scraped_at": datetime.now().isoformat(),
-                                        "is_valid_post": True,  # All containers treated as valid
-                                        "container_info": {
-                                            "role": role,
-                                            "data_testid": data_testid,
-                                            "class": class_attr,
-                                        },
-                                        "content_data": content_data,
-                                    }
-                                    posts.append(post_data)
-                                    self.logger.info(
-                                        f"📸 Captured ALL container {len(posts)}: {os.path.basename(screenshot_path)} (validation disabled)"
-                                    )
-                                else:
-                                    self.logger.warning(
-                                        f"Failed to capture screenshot for container {i + 1}"
-                                    )
+                        continue
+                    candidates.append((i, meta))
+
+                # Capture pass, pipelined one post deep: the next post is loaded
+                # and expanded while the previous post's expanded content settles
+                remaining = iter(candidates)
+                prepared = self._prepare_next_container(remaining)
+                while prepared and len(posts) < max_posts:
+                    upcoming = None
+                    if len(posts) + 1 < max_posts:
+                        upcoming = self._prepare_next_container(remaining)
+
+                    post_data = self._capture_prepared_container(prepared, len(posts) + 1)
+                    if post_data:
+                        posts.append(post_data)
+                        pending_posts.append(post_data)
+                        seen_keys.add(prepared[1]["key"])
+                        screenshot_name = os.path.basename(post_data["screenshot_path"])
+                        if self.validate_posts:
+                            self.logger.info(
+                                f"✅ Captured VALID post {len(posts)}: {screenshot_name}"
+                            )
                         else:
-                            # Container not fully loaded - skip processing
-                            self.logger.warning(
-                                f"⚠️ Container {i + 1} not fully loaded - skipping processing"
+                            self.logger.info(
+                                f"📸 Captured ALL container {len(posts)}: {screenshot_name} (validation disabled)"
                             )
 
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Error processing container {i + 1}: {str(e)}"
+                    # Still short of max_posts (e.g. this capture failed): keep going
+                    if upcoming is None and len(posts) < max_posts:
+                        upcoming = self._prepare_next_container(remaining)
+                    prepared = upcoming
+
+                if pending_posts:
+                    # A failed write (e.g. "database is locked" while parallel
+                    # workers insert) must not discard the posts already captured
+                    try:
+                        self.db_manager.insert_posts_batch(
+                            [self._to_database_row(post, target_url) for post in pending_posts]
+                        )
+                    except sqlite3.Error as e:
+                        self.logger.error(
+                            f"❌ Failed to save {len(pending_posts)} posts to database: {str(e)}"
                         )
-                        continue
 
                 # Scroll to load more content if we need more posts
                 if len(posts) < max_posts:
-                    self.human_behavior.human_scroll("down", random.randint(600, 1000))
+                    self.human_behavior.human_scroll("down", self._next_scroll_distance())
                     self.human_behavior.random_delay(2, 4)
                     scroll_attempts += 1
                     self.logger.info(
@@ -375,6 +823,9 @@ class FacebookUIScraper(BaseScraper):
                 f"🎯 Scraping completed! Captured {len(posts)} posts in {scroll_attempts} scroll attempts"
             )
             
+            # Make sure every screenshot is on disk before reporting paths
+            self._screenshot_writer.flush()
+
             # Automatically save detailed content data to JSON file
             if posts:
                 try:
@@ -392,177 +843,255 @@ class FacebookUIScraper(BaseScraper):
             self.logger.error(f"Error scraping posts: {str(e)}")
             return []
 
-    def _is_actual_post(self, container) -> bool:
-        """Determine if a container is an actual post, not a comment or other element."""
+    def _make_post_data(
+        self,
+        post_number: int,
+        screenshot_path: str,
+        role: str,
+        data_testid: str,
+        class_attr: str,
+        content_data: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the record returned by scrape_posts for one captured post."""
+        return {
+            "post_id": f"post_{post_number:03d}",
+            "screenshot_path": screenshot_path,
+            "scraped_at": datetime.now().isoformat(),
+            "is_valid_post": True,
+            "container_info": {
+                "role": role,
+                "data_testid": data_testid,
+                "class": class_attr,
+            },
+            "content_data": content_data,
+        }
+
+    def _next_scroll_distance(self) -> int:
+        """Scroll far enough to bring the last loaded post to the bottom of the viewport.
+
+        Every container already on the page is handled in the current pass, so
+        the next scroll only needs to reach the end of the loaded feed, which
+        makes Facebook load the next batch. Scrolls at least 90% of a screen.
+        """
         try:
-            # Check for post-specific attributes
-            role = container.get_attribute("role")
-            data_testid = container.get_attribute("data-testid")
-            class_attr = container.get_attribute("class") or ""
-
-            # Enhanced post detection for Facebook 2025 UI
-            # Check multiple indicators to confirm it's a real post
-
-            # 1. Primary check: role="article" or data-testid containing "post"
-            if role != "article" and (
-                not data_testid or "post" not in str(data_testid)
-            ):
-                return False
+            layout = self.driver.execute_script(
+                _SCROLL_LAYOUT_JS, _POST_CONTAINER_SELECTOR
+            )
+            viewport_height = layout["viewportH"]
+            bottoms = layout["bottoms"]
+            if bottoms:
+                return int(max(viewport_height * 0.9, bottoms[-1] - viewport_height))
+        except (WebDriverException, KeyError, TypeError) as e:
+            self.logger.debug("Could not measure feed layout: %s", e)
+        return random.randint(600, 1000)
+
+    def _to_database_row(self, post: Dict[str, Any], target_url: str) -> Dict[str, Any]:
+        """Map a captured post onto the columns of the posts table."""
+        # The screenshot name is unique across sessions and workers, unlike the
+        # per-run post_id
+        post_id = os.path.splitext(os.path.basename(post["screenshot_path"]))[0]
+        group_name = None
+        if "/groups/" in target_url:
+            group_name = target_url.split("/groups/", 1)[1].strip("/").split("/")[0]
+        return {
+            "post_id": post_id,
+            "content": (post.get("content_data") or {}).get("post_text"),
+            "post_url": target_url,
+            "group_name": group_name,
+            "scraped_at": post["scraped_at"],
+        }
+
+    def _wait_for(
+        self, condition, timeout: float, poll_frequency: float = 0.5
+    ) -> bool:
+        """Wait until an expected condition holds, returning False on timeout."""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency).until(
+                condition
+            )
+            return True
+        except TimeoutException:
+            return False
 
-            # 2. Check for modern Facebook post containers using class patterns
-            modern_post_classes = [
-                "userContentWrapper",  # Classic Facebook post wrapper
-                "du4w35lb",  # Modern Facebook post class
-                "k4urcfbm",  # Another modern post identifier
-                "l9j0dhe7",  # Post container class
-                "sjgh65i0",  # Post wrapper class
-                "xd9ej83",  # New Facebook feed post class
-                "x162z183",  # New Facebook feed post class
-                "xsag5q8",  # New Facebook feed post class
-                "xf7dkkf",  # New Facebook feed post class
-            ]
-
-            has_modern_post_class = any(
-                cls in class_attr for cls in modern_post_classes
+    def _wait_for_feed(self, timeout: float = 10) -> bool:
+        """Wait for the feed or its first post to render after navigation."""
+        ready = self._wait_for(
+            EC.presence_of_element_located((By.CSS_SELECTOR, _FEED_READY_SELECTOR)),
+            timeout,
+        )
+        if not ready:
+            self.logger.warning(f"Feed did not render within {timeout} seconds")
+        return ready
+
+    def _fetch_container_metadata(self) -> List[Dict[str, Any]]:
+        """Find feed post containers and read their validation attributes in one call.
+
+        Each entry holds the container WebElement under ``"element"`` (still
+        needed for clicks and screenshots) plus the attributes consumed by
+        :meth:`_is_actual_post_from_meta`.
+        """
+        try:
+            metadata = self.driver.execute_script(
+                _CONTAINER_METADATA_JS,
+                _POST_CONTAINER_SELECTOR,
+                _POST_MESSAGE_SELECTOR,
+                _AUTHOR_SELECTOR,
+                _NON_POST_SELECTOR,
+                _ENGAGEMENT_SELECTOR,
             )
+        except WebDriverException as e:
+            self.logger.debug(f"Feed structure not found: {str(e)}")
+            return []
 
-            # 3. Check for post message content (multiple selectors for robustness)
-            post_message_selectors = [
-                "[data-testid='post_message']",
-                "[data-testid='message']",
-                "div[data-testid='post_message']",
-                "div[data-testid='message']",
-            ]
-
-            has_post_message = False
-            for selector in post_message_selectors:
-                if container.find_elements(By.CSS_SELECTOR, selector):
-                    has_post_message = True
-                    break
+        if metadata is None:
+            self.logger.debug("Feed structure not found")
+            return []
 
-            if not has_post_message:
-                return False
+        if metadata:
+            self.logger.info("✅ Found posts using Facebook feed structure")
+        else:
+            self.logger.info("Feed found but no posts with expected classes")
+        return metadata
 
-            # 4. Check for author information (multiple selectors)
-            author_selectors = [
-                "h3 a",
-                "a[class*='x1i10hfl']",
-                "[data-testid='post_author']",
-                "[data-testid='author']",
-                "[data-testid='user_name']",
-                "a[href*='/profile.php']",
-                "a[href*='/']",
-            ]
-
-            has_author = False
-            for selector in author_selectors:
-                if container.find_elements(By.CSS_SELECTOR, selector):
-                    has_author = True
-                    break
+    def _is_actual_post_from_meta(self, meta: Dict[str, Any]) -> bool:
+        """Determine if a container is an actual post from its prefetched metadata.
 
-            if not has_author:
-                return False
+        The metadata comes from :meth:`_fetch_container_metadata`, so the
+        filter needs no further WebDriver round-trips.
+        """
+        data_testid = meta["testid"]
+        class_attr = meta["class"] or ""
 
-            # 5. Check that it's NOT a comment, reply, or other UI element
-            non_post_indicators = [
-                "[data-testid='comment']",
-                "[data-testid='reply']",
-                "[data-testid='comment_reply']",
-                "div[aria-label*='comment']",
-                "div[aria-label*='reply']",
-                "[data-testid='UFI2Comment']",
-                "[data-testid='UFI2Reply']",
-            ]
-
-            for indicator in non_post_indicators:
-                if container.find_elements(By.CSS_SELECTOR, indicator):
-                    return False
-
-            # 6. Additional validation: Check for engagement elements (likes, comments, shares)
-            engagement_selectors = [
-                "[data-testid='UFI2ReactionsCount']",
-                "[data-testid='UFI2CommentsCount']",
-                "[data-testid='UFI2SharesCount']",
-                "[aria-label*='reaction']",
-                "[aria-label*='comment']",
-                "[aria-label*='share']",
-            ]
-
-            has_engagement = any(
-                container.find_elements(By.CSS_SELECTOR, selector)
-                for selector in engagement_selectors
-            )
+        # 1. Primary check: role="article" or data-testid containing "post"
+        if meta["role"] != "article" and (not data_testid or "post" not in data_testid):
+            return False
 
-            # 7. Final validation: Must pass all checks
-            return has_modern_post_class or has_engagement
-            
-        except Exception as e:
-            self.logger.debug(f"Error checking if actual post: {str(e)}")
+        # 3-5. Must have a message and an author, and must not be a comment/reply
+        if not meta["has_message"] or not meta["has_author"] or meta["is_comment"]:
             return False
 
+        # 6-7. Final validation: engagement elements or a modern Facebook post
+        # container class; the boolean is checked first so most posts skip the regex
+        return meta["has_engagement"] or bool(_MODERN_POST_CLASS_RE.search(class_attr))
+
     def _wait_for_container_loaded(self, container) -> bool:
         """Wait for a container to be fully loaded before processing."""
         try:
             if not self.driver:
                 return False
 
-            # Wait for key elements that indicate the post is fully loaded
-            wait_selectors = [
-                "[data-testid='post_message']",  # Post content
-                "[data-testid='message']",  # Alternative post content
-                "h3 a",  # Author name
-                "a[class*='x1i10hfl']",  # Author link
-                "[data-testid='post_author']",  # Author
-                "[data-testid='author']",  # Alternative author
-            ]
-
             # Check if at least one key element is present and visible
-            for selector in wait_selectors:
-                try:
-                    elements = container.find_elements(By.CSS_SELECTOR, selector)
-                    if elements and any(elem.is_displayed() for elem in elements):
-                        # Found a key element, wait a bit more for content to stabilize
-                        self.human_behavior.random_delay(0.5, 1.5)
-                        return True
-                except Exception:
-                    continue
-                            
+            if self._has_visible_match(container, _LOADED_MARKER_SELECTOR):
+                # Found a key element, wait a bit more for content to stabilize
+                self.human_behavior.random_delay(0.5, 1.5)
+                return True
+
             # If no key elements found, wait a bit and check again
             self.human_behavior.random_delay(1, 2)
 
             # Final check
-            for selector in wait_selectors:
-                try:
-                    elements = container.find_elements(By.CSS_SELECTOR, selector)
-                    if elements and any(elem.is_displayed() for elem in elements):
-                        return True
-                except Exception:
-                    continue
-                    
-            return False
+            return self._has_visible_match(container, _LOADED_MARKER_SELECTOR)
 
         except Exception as e:
             self.logger.debug(f"Error waiting for container to load: {str(e)}")
             return False
 
+    def _has_visible_match(self, container, selector: str) -> bool:
+        """Return True if any element under the container matching selector is visible."""
+        return bool(
+            container.parent.execute_script(_HAS_VISIBLE_MATCH_JS, container, selector)
+        )
+
+    def _prepare_next_container(
+        self, candidates: Iterator[Tuple[int, Dict[str, Any]]]
+    ) -> Optional[Tuple[int, Dict[str, Any], Optional[float]]]:
+        """First pipeline stage: wait for the next loadable container and expand it.
+
+        Returns:
+            ``(index, meta, expanded_at)`` for the first container that loaded,
+            where ``expanded_at`` is the monotonic time of the expand click (None
+            if nothing was expanded), or None when no candidates are left.
+        """
+        for i, meta in candidates:
+            try:
+                # Wait for the container to be fully loaded before processing
+                if not self._wait_for_container_loaded(meta["element"]):
+                    # Container not fully loaded - skip processing
+                    self.logger.warning(
+                        f"⚠️ Container {i + 1} not fully loaded - skipping processing"
+                    )
+                    continue
+
+                # Look for and click expandable buttons before processing
+                buttons_clicked = self._click_expandable_buttons(meta["element"], i + 1)
+                return i, meta, time.monotonic() if buttons_clicked else None
+
+            except Exception as e:
+                self.logger.warning(f"Error processing container {i + 1}: {str(e)}")
+
+        return None
+
+    def _capture_prepared_container(
+        self,
+        prepared: Tuple[int, Dict[str, Any], Optional[float]],
+        post_number: int,
+    ) -> Optional[Dict[str, Any]]:
+        """Second pipeline stage: extract content from an expanded container and screenshot it."""
+        i, meta, expanded_at = prepared
+        container = meta["element"]
+        try:
+            # Extract content data after clicking expand buttons
+            content_data = self.extract_content_data(container)
+
+            screenshot_path = self._capture_screenshot_with_wait(
+                container, i + 1, expanded_at=expanded_at
+            )
+            if not screenshot_path:
+                self.logger.warning(f"Failed to capture screenshot for container {i + 1}")
+                return None
+
+            return self._make_post_data(
+                post_number,
+                screenshot_path,
+                meta["role"] or "no-role",
+                meta["testid"] or "no-testid",
+                meta["class"] or "no-class",
+                content_data,
+            )
+
+        except Exception as e:
+            self.logger.warning(f"Error processing container {i + 1}: {str(e)}")
+            return None
+
     def _capture_screenshot_with_wait(
-        self, container, post_index: int
+        self, container, post_index: int, expanded_at: Optional[float] = None
     ) -> Optional[str]:
-        """Capture a screenshot of a post container with additional waiting for content stability."""
+        """Capture a screenshot of a post container with additional waiting for content stability.
+
+        ``expanded_at`` is the monotonic time the post was expanded. Expanded
+        posts get a short settling pause for animations, minus whatever time
+        has already passed since the expand click.
+        """
         try:
             if not self.driver:
                 return None
                 
             # Wait a bit more for any remaining animations or content to settle
-            self.human_behavior.random_delay(0.5, 1.0)
+            if expanded_at is not None:
+                settle = random.uniform(0.5, 1.0) - (time.monotonic() - expanded_at)
+                if settle > 0:
+                    time.sleep(settle)
+
+            # Capture the container; decoding and the disk write run in the background
+            data, image_format = self._capture_container_image(container)
 
             # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"post_{post_index:03d}_{timestamp}.png"
-            filepath = os.path.join(self.screenshot_dir, filename)
-            
-            # Capture screenshot of the container
-            container.screenshot(filepath)
+            filename = (
+                f"post_{post_index:03d}_{self._session_ts}_"
+                f"{next(self._capture_counter):06d}.{_IMAGE_EXTENSIONS[image_format]}"
+            )
+            filepath = self._screenshot_prefix + filename
+            self._screenshot_writer.submit(filepath, data)
 
             self.logger.info(f"📸 Screenshot captured: {filename}")
             return filepath
@@ -571,62 +1100,67 @@ class FacebookUIScraper(BaseScraper):
             self.logger.error(f"Failed to capture screenshot: {str(e)}")
             return None
 
-    def _click_expandable_buttons(self, container, post_index: int) -> None:
-        """Look for and click expandable buttons (like 'See more', 'Show more') within a post container."""
+    def _capture_container_image(self, container) -> Tuple[str, str]:
+        """Capture an image of a container, clipped and encoded by Chrome via CDP.
+
+        The clip rectangle is read right before capturing because expanding
+        "See more" changes the container's size and position. Falls back to
+        a PNG WebElement screenshot if the CDP command is unavailable or fails.
+
+        Returns:
+            The encoded image as base64, left for the screenshot writer thread
+            to decode, and the format it is in.
+        """
+        params: Dict[str, Any] = {
+            "format": self.image_format,
+            "captureBeyondViewport": True,
+            # Fast encoder settings: slightly larger files, much less CPU
+            "optimizeForSpeed": True,
+        }
+        if self.image_format != "png":
+            params["quality"] = self.image_quality
+
+        try:
+            params["clip"] = self.driver.execute_script(_ELEMENT_CLIP_JS, container)
+            result = self.driver.execute_cdp_cmd("Page.captureScreenshot", params)
+            return result["data"], self.image_format
+        except (WebDriverException, AttributeError, KeyError) as e:
+            self.logger.debug("CDP screenshot failed, using element screenshot: %s", e)
+            return container.screenshot_as_base64, "png"
+
+    def _click_expandable_buttons(self, container, post_index: int) -> int:
+        """Look for and click expandable buttons (like 'See more', 'Show more') within a post container.
+
+        Returns:
+            int: Number of buttons clicked
+        """
+        buttons_clicked = 0
         try:
             if not self.driver:
-                return
-
-            # Common expandable button selectors
-            expand_button_selectors = [
-                # Facebook's "See more" button with full class list
-                "div.x1i10hfl.xjbqb8w.x1ejq31n.x18oe1m7.x1sy0etr.xstzfhl.x972fbf.x10w94by.x1qhh985.x14e42zd.x9f619.x1ypdohk.xt0psk2.x3ct3a4.xdj266r.x14z9mp.xat24cr.x1lziwak.xexx8yu.xyri2b.x18d9i69.x1c1uobl.x16tdsg8.x1hl2dhg.xggy1nq.x1a2a7pz.xkrqix3.x1sur9pj.xzsf02u.x1s688f[role='button']",
-                # # Partial class match for "See more" button (more flexible)
-                # "div[class*='x1i10hfl'][class*='x1ypdohk'][role='button']",
-                # # Button containing "See more" text
-                # "div[role='button']:has-text('See more')",
-            ]
-
-            buttons_clicked = 0
-            
-            for selector in expand_button_selectors:
+                return 0
+
+            # Resolve the first visible, enabled expand button and its label in one call
+            button = container.parent.execute_script(
+                _FIRST_CLICKABLE_JS, container, _EXPAND_BUTTON_SELECTOR
+            )
+
+            # Process only the first clickable button found
+            if button:
                 try:
-                    # Find buttons within this container
-                    buttons = container.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    # Find the first clickable button instead of looping through all
-                    first_clickable_button = None
-                    for button in buttons:
-                        try:
-                            if button.is_displayed() and button.is_enabled():
-                                first_clickable_button = button
-                                break
-                        except Exception as e:
-                            self.logger.debug(f"Error checking button in post {post_index}: {str(e)}")
-                            continue
-                    
-                    # Process only the first clickable button found
-                    if first_clickable_button:
-                        try:
-                            # Get button text for logging
-                            button_text = first_clickable_button.text or first_clickable_button.get_attribute("aria-label") or "unknown"
-                            
-                            # Click the first button found
-                            self.human_behavior.human_click(first_clickable_button)
-                            buttons_clicked += 1
-                            
-                            self.logger.info(f"🔘 Clicked FIRST expand button '{button_text}' in post {post_index}")
-                            
-                            # Wait a bit for content to expand
-                            self.human_behavior.random_delay(0.5, 1.0)
-                            
-                        except Exception as e:
-                            self.logger.debug(f"Failed to click first button in post {post_index}: {str(e)}")
-                            
+                    button_text = button["label"] or "unknown"
+
+                    # Click the first button found
+                    self.human_behavior.human_click(button["element"])
+                    buttons_clicked += 1
+
+                    self.logger.info(f"🔘 Clicked FIRST expand button '{button_text}' in post {post_index}")
+
+                    # Wait for the button to go away as the content expands
+                    self._wait_for(EC.invisibility_of_element(button["element"]), 1)
+
                 except Exception as e:
-                    self.logger.debug(f"Error with selector '{selector}' in post {post_index}: {str(e)}")
-                    continue
-            
+                    self.logger.debug("Failed to click first button in post %s: %s", post_index, e)
+
             if buttons_clicked > 0:
                 self.logger.info(f"🔘 Total buttons clicked in post {post_index}: {buttons_clicked}")
             else:
@@ -635,6 +1169,8 @@ class FacebookUIScraper(BaseScraper):
         except Exception as e:
             self.logger.debug(f"Error clicking expandable buttons in post {post_index}: {str(e)}")
 
+        return buttons_clicked
+
     def extract_content_data(self, container) -> Optional[Dict[str, Any]]:
         """Extract text content and image information from a post container using specific class names."""
         try:
@@ -647,105 +1183,26 @@ class FacebookUIScraper(BaseScraper):
                 "extraction_timestamp": datetime.now().isoformat()
             }
 
-            # Extract post text using the class from post_example.py
-            try:
-                # Look for post text with the specific class pattern
-                post_text_selectors = [
-                    "div.xdj266r.x14z9mp.xat24cr.x1lziwak.x1vvkbs.x126k92a",  # From post_example.py
-                    "div[data-testid='post_message']",  # Fallback
-                    "div[data-testid='message']",  # Alternative fallback
-                ]
-                
-                for selector in post_text_selectors:
-                    text_elements = container.find_elements(By.CSS_SELECTOR, selector)
-                    if text_elements:
-                        for text_elem in text_elements:
-                            if text_elem.is_displayed():
-                                text_content = text_elem.text.strip()
-                                if text_content:
-                                    content_data["post_text"] = text_content
-                                    self.logger.debug(f"📝 Extracted post text: {text_content[:100]}...")
-                                    break
-                        if content_data["post_text"]:
-                            break
-            except Exception as e:
-                self.logger.debug(f"Error extracting post text: {str(e)}")
-
-            # Extract image information using the classes from post_example.py
+            # Extract post text, images and image links in one in-page pass
             try:
-                # Look for image containers with the specific class pattern
-                image_container_selectors = [
-                    "div.x1i10hfl.xjbqb8w.x1ejq31n.x13faqbe.x1vvkbs.x126k92a.x193iq5w",  # From post_example.py
-                    "div.x17z8epw.x579bpy.x1s688f.x2b8uid",  # Image remaining class
-                    "img[src*='scontent']",  # Facebook image URLs
-                    "img[data-visualcompletion='media-vc-image']",  # Facebook image attribute
-                ]
-                
-                for selector in image_container_selectors:
-                    image_elements = container.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for img_elem in image_elements:
-                        try:
-                            if img_elem.is_displayed():
-                                # Extract image information
-                                img_src = img_elem.get_attribute("src")
-                                img_alt = img_elem.get_attribute("alt") or "No alt text"
-                                img_title = img_elem.get_attribute("title") or "No title"
-                                
-                                if img_src and "scontent" in img_src:  # Facebook CDN URL
-                                    image_info = {
-                                        "src": img_src,
-                                        "alt": img_alt,
-                                        "title": img_title,
-                                        "class": img_elem.get_attribute("class") or "unknown"
-                                    }
-                                    content_data["images"].append(image_info)
-                                    self.logger.debug(f"🖼️ Found image: {img_alt[:50]}...")
-                        except Exception as e:
-                            self.logger.debug(f"Error processing image element: {str(e)}")
-                            continue
-                            
-            except Exception as e:
-                self.logger.debug(f"Error extracting image information: {str(e)}")
-
-            # Extract image links if available
-            try:
-                # Look for clickable image links
-                image_link_selectors = [
-                    "a[class*='x1i10hfl'][class*='x1qjc9v5'][role='link']",  # From post_example.py (partial)
-                    "a[href*='photo']",  # Facebook photo links
-                    "a[href*='story_fbid']",  # Facebook story links
-                ]
-                
-                for selector in image_link_selectors:
-                    link_elements = container.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for link_elem in link_elements:
-                        try:
-                            if link_elem.is_displayed():
-                                href = link_elem.get_attribute("href")
-                                if href and ("photo" in href or "story_fbid" in href):
-                                    # Check if this link corresponds to an image we already found
-                                    link_text = link_elem.text.strip()
-                                    link_aria_label = link_elem.get_attribute("aria-label") or ""
-                                    
-                                    link_info = {
-                                        "href": href,
-                                        "text": link_text,
-                                        "aria_label": link_aria_label,
-                                        "class": link_elem.get_attribute("class") or "unknown"
-                                    }
-                                    
-                                    # Add to images if it's not already there
-                                    if not any(img.get("href") == href for img in content_data["images"]):
-                                        content_data["images"].append(link_info)
-                                        self.logger.debug(f"🔗 Found image link: {href[:100]}...")
-                        except Exception as e:
-                            self.logger.debug(f"Error processing image link: {str(e)}")
-                            continue
-                            
+                content = container.parent.execute_script(
+                    _POST_CONTENT_JS,
+                    container,
+                    list(_POST_TEXT_SELECTORS),
+                    _IMAGE_CONTAINER_SELECTOR,
+                    _IMAGE_LINK_SELECTOR,
+                )
+                if content["text"]:
+                    content_data["post_text"] = content["text"]
+                    self.logger.debug("📝 Extracted post text: %.100s...", content["text"])
+                for image_info in content["images"]:
+                    content_data["images"].append(image_info)
+                    self.logger.debug("🖼️ Found image: %.50s...", image_info["alt"])
+                for link_info in content["links"]:
+                    content_data["images"].append(link_info)
+                    self.logger.debug("🔗 Found image link: %.100s...", link_info["href"])
             except Exception as e:
-                self.logger.debug(f"Error extracting image links: {str(e)}")
+                self.logger.debug(f"Error extracting post content: {str(e)}")
 
             # Log extraction summary
             if content_data["post_text"] or content_data["images"]:
@@ -759,8 +1216,17 @@ class FacebookUIScraper(BaseScraper):
             self.logger.error(f"Error in extract_content_data: {str(e)}")
             return None
 
-    def save_content_data_to_detailed_json(self, posts: List[Dict[str, Any]], filename: Optional[str] = None) -> str:
-        """Save detailed content data to a JSON file with enhanced formatting and analysis."""
+    def save_content_data_to_detailed_json(
+        self,
+        posts: List[Dict[str, Any]],
+        filename: Optional[str] = None,
+        pretty: bool = False,
+    ) -> str:
+        """Save detailed content data to a JSON file with analysis.
+
+        The file is written as compact JSON; pass ``pretty=True`` for
+        human-readable, indented output.
+        """
         try:
             if not posts:
                 self.logger.warning("No posts data to save")
@@ -768,13 +1234,13 @@ class FacebookUIScraper(BaseScraper):
 
             # Generate filename if not provided
             if not filename:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
                 filename = f"facebook_detailed_content_{timestamp}.json"
 
             # Prepare detailed data structure
             detailed_data = {
                 "metadata": {
-                    "export_timestamp": datetime.now().isoformat(),
+                    "export_timestamp": datetime.now(),
                     "total_posts": len(posts),
                     "scraper_version": "1.0",
                     "facebook_ui_version": "2025",
@@ -807,30 +1273,23 @@ class FacebookUIScraper(BaseScraper):
                 detailed_data["metadata"]["content_summary"]["total_images_found"] += len(content_data.get("images", []))
 
                 # Create detailed post entry
-                detailed_post = {
-                    "post_id": post.get("post_id", "unknown"),
-                    "scraped_at": post.get("scraped_at", ""),
-                    "screenshot_path": post.get("screenshot_path", ""),
-                    "is_valid_post": post.get("is_valid_post", False),
-                    "container_info": post.get("container_info", {}),
-                    "content_analysis": {
-                        "has_text": has_text,
-                        "has_images": has_images,
-                        "text_length": len(content_data.get("post_text", "")) if content_data.get("post_text") else 0,
-                        "image_count": len(content_data.get("images", [])),
-                        "content_type": self._determine_content_type(content_data)
-                    },
-                    "content_data": content_data
+                detailed_post = {key: post.get(key, default) for key, default in _POST_COPY_KEYS}
+                detailed_post["content_analysis"] = {
+                    "has_text": has_text,
+                    "has_images": has_images,
+                    "text_length": len(content_data.get("post_text", "")) if content_data.get("post_text") else 0,
+                    "image_count": len(content_data.get("images", [])),
+                    "content_type": self._determine_content_type(content_data)
                 }
+                detailed_post["content_data"] = content_data
                 
                 detailed_data["posts"].append(detailed_post)
 
             # Save to JSON file
             filepath = os.path.join(os.getcwd(), str(filename))
             
-            import json
-            with open(filepath, 'w', encoding='utf-8') as json_file:
-                json.dump(detailed_data, json_file, indent=2, ensure_ascii=False, default=str)
+            with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as json_file:
+                json_file.write(_dumps_json(detailed_data, pretty=pretty))
 
             self.logger.info(f"💾 Detailed content data saved to JSON: {filename}")
             self.logger.info(f"📊 Exported {len(posts)} posts with detailed analysis")
@@ -858,6 +1317,103 @@ class FacebookUIScraper(BaseScraper):
         except Exception:
             return "unknown"
 
+    async def scrape_posts_async(
+        self, target_url: str, max_posts: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Run scrape_posts in a worker thread so asyncio callers are not blocked.
+
+        A single scraper drives one browser, so concurrent calls on the same
+        instance are not supported; use scrape_urls to scrape several URLs at once.
+        """
+        return await asyncio.to_thread(self.scrape_posts, target_url, max_posts)
+
+    def scrape_urls(
+        self,
+        urls: List[str],
+        max_posts_each: int = 10,
+        workers: int = 4,
+        headless: bool = True,
+        credentials: Optional[Dict[str, str]] = None,
+        profile_root: str = "chrome_profiles",
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Scrape several URLs in parallel, one Chrome instance per worker.
+
+        Each worker is an independent FacebookUIScraper with its own profile
+        directory, debugging port and screenshot subdirectory, and scrapes its
+        share of the URLs one after another. Page loads and rendering dominate
+        the cost, so throughput scales with the number of browsers until CPU or
+        network saturate. All workers share this scraper's database manager.
+
+        Args:
+            urls: Facebook URLs to scrape.
+            max_posts_each: Maximum posts to capture per URL.
+            workers: Number of Chrome instances to run at once.
+            headless: Run the worker browsers in headless mode.
+            credentials: Optional login used when a worker profile has no session.
+            profile_root: Directory holding the per-worker Chrome profiles.
+
+        Returns:
+            Dict mapping each URL to its captured posts.
+        """
+        if not urls:
+            return {}
+
+        workers = max(1, min(workers, len(urls)))
+        assignments = [urls[i::workers] for i in range(workers)]
+        results: Dict[str, List[Dict[str, Any]]] = {}
+
+        def run_worker(
+            index: int, worker_urls: List[str]
+        ) -> Dict[str, List[Dict[str, Any]]]:
+            scraper = FacebookUIScraper(
+                db_path=self.db_manager.db_path,
+                validate_posts=self.validate_posts,
+                image_format=self.image_format,
+                image_quality=self.image_quality,
+                screenshot_dir=os.path.join(self.screenshot_dir, f"worker_{index}"),
+                profile_dir=os.path.abspath(
+                    os.path.join(profile_root, f"chrome_profile_{index}")
+                ),
+                debug_port=_BASE_DEBUG_PORT + index,
+                block_media=self.block_media,
+                # Start every worker from the parent's saved session
+                cookies_path=self.cookies_path,
+            )
+            worker_results = {}
+            try:
+                if not scraper.setup_driver(headless=headless):
+                    return {url: [] for url in worker_urls}
+                if credentials:
+                    scraper.authenticate(credentials)
+                for url in worker_urls:
+                    worker_results[url] = scraper.scrape_posts(url, max_posts_each)
+            finally:
+                scraper.close()
+            return worker_results
+
+        self.logger.info(
+            f"🚀 Scraping {len(urls)} URLs with {workers} parallel Chrome workers..."
+        )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(run_worker, i, worker_urls): worker_urls
+                for i, worker_urls in enumerate(assignments)
+            }
+            for future in as_completed(futures):
+                try:
+                    results.update(future.result())
+                except Exception as e:
+                    self.logger.error(f"Scraper worker failed: {str(e)}")
+                    for url in futures[future]:
+                        results.setdefault(url, [])
+
+        return {url: results.get(url, []) for url in urls}
+
     def scrape_content(self, target_url: str, max_items: int = 20) -> List[Any]:
         """Implementation of abstract method from BaseScraper."""
         return self.scrape_posts(target_url, max_items)
+
+    def close(self):
+        """Flush pending screenshot writes, then clean up resources."""
+        self._screenshot_writer.close()
+        super().close()
@@ -4,13 +4,21 @@ Google Scraper Module
 Google search result scraper for testing purposes.
 """
 
+import asyncio
+import json
 import time
-import re
 from datetime import datetime
+from urllib.parse import parse_qs, urlparse
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib json module
+    orjson = None
+
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -18,11 +26,11 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.keys import Keys
 from webdriver_manager.chrome import ChromeDriverManager
-from fake_useragent import UserAgent
 from dotenv import load_dotenv
 
 from .base_scraper import BaseScraper, ScrapedContent
-from database.database import DatabaseManager
+from database.database import get_database_manager
+from utils.human_behavior import get_user_agent
 from config.config import (
     find_chrome_driver,
     find_chrome_binary,
@@ -32,30 +40,60 @@ from config.config import (
 # Load environment variables
 load_dotenv()
 
+# CSS selector of one organic search result
+_RESULT_SELECTOR = "div.g"
+
+# Title, link, snippet and source domain (the author) of the first
+# arguments[0] results in one round trip. Results missing any of the first
+# three come back as null and are skipped.
+_SEARCH_RESULTS_JS = f"""
+return Array.from(document.querySelectorAll('{_RESULT_SELECTOR}'))
+    .slice(0, arguments[0])
+    .map(g => {{
+        const title = g.querySelector('h3');
+        const link = g.querySelector('a');
+        const snippet = g.querySelector('div.VwiC3b');
+        if (!title || !link || !snippet) return null;
+        const url = link.href || '';
+        let host = '';
+        try {{
+            host = new URL(url).host.replace(/^www\\./, '');
+        }} catch (e) {{}}
+        return {{
+            title: title.innerText,
+            url: url,
+            snippet: snippet.innerText,
+            author: host || 'Unknown',
+        }};
+    }});
+"""
+
+# Page height and number of loaded results, read in one round trip
+_RESULTS_STATE_JS = f"""
+return [document.body.scrollHeight,
+        document.querySelectorAll('{_RESULT_SELECTOR}').length];
+"""
+
 
-@dataclass
+@dataclass(slots=True)
 class GoogleSearchResult(ScrapedContent):
     """Google search result data model."""
 
-    # Override base class fields with defaults
-    content: str
-    url: str
-    scraped_at: str
+    # Override the base class default so titles are always strings
     title: str = ""
     snippet: str = ""
     position: int = 0
-    # Optional fields with defaults
-    content_id: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
 
 
 class GoogleScraper(BaseScraper):
     """Google search result scraper for testing purposes."""
 
-    def __init__(self, db_path: str = "google_search_results.db"):
+    def __init__(
+        self, db_path: str = "google_search_results.db", batch_size: int = 5000
+    ):
         super().__init__(name="GoogleScraper")
-        self.ua = UserAgent()
-        self.db_manager = DatabaseManager(db_path)
+        self.batch_size = batch_size
+        self.db_manager = get_database_manager(db_path)
         self.search_results = []
 
     def setup_driver(self, headless: bool = True) -> bool:
@@ -91,7 +129,7 @@ class GoogleScraper(BaseScraper):
                 chrome_options.add_experimental_option("useAutomationExtension", False)
 
             # Set user agent
-            chrome_options.add_argument(f"--user-agent={self.ua.random}")
+            chrome_options.add_argument(f"--user-agent={get_user_agent().random}")
 
             # Find Chrome driver and binary paths
             driver_path = find_chrome_driver()
@@ -104,11 +142,15 @@ class GoogleScraper(BaseScraper):
             # Create service with found driver path or fallback to webdriver_manager
             if driver_path:
                 service = Service(driver_path)
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                self.driver = webdriver.Chrome(
+                    service=service, options=chrome_options, keep_alive=True
+                )
             else:
                 # Fallback to webdriver_manager if no local driver found
                 service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                self.driver = webdriver.Chrome(
+                    service=service, options=chrome_options, keep_alive=True
+                )
 
             # Set window size
             self.driver.set_window_size(1920, 1080)
@@ -136,7 +178,8 @@ class GoogleScraper(BaseScraper):
 
     def validate_target_url(self, url: str) -> bool:
         """Validate if the target URL is a Google search URL."""
-        return "google.com" in url.lower() or "google.co" in url.lower()
+        # "google.co" also matches google.com and country domains like google.co.th
+        return "google.co" in url.lower()
 
     def pre_scraping_setup(self, target_url: str) -> bool:
         """Navigate to Google search page."""
@@ -193,8 +236,13 @@ class GoogleScraper(BaseScraper):
             search_box.send_keys(search_query)
             search_box.send_keys(Keys.RETURN)
 
-            # Wait for results to load
-            time.sleep(3)
+            # Wait for the first results to render rather than a fixed pause
+            try:
+                WebDriverWait(self.driver, 10, poll_frequency=0.2).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _RESULT_SELECTOR))
+                )
+            except TimeoutException:
+                self.logger.warning("Search results did not load within 10 seconds")
 
             # Scroll to load more results if needed
             self._scroll_for_more_results(max_results)
@@ -227,14 +275,26 @@ class GoogleScraper(BaseScraper):
             self.logger.error(f"Failed to scrape Google search results: {str(e)}")
             return []
 
+    async def scrape_search_results_async(
+        self, target_url: str, max_results: int = 20
+    ) -> List[ScrapedContent]:
+        """Run scrape_search_results in a worker thread so asyncio callers are not blocked.
+
+        A single scraper drives one browser, so concurrent calls on the same
+        instance are not supported.
+        """
+        return await asyncio.to_thread(
+            self.scrape_search_results, target_url, max_results
+        )
+
     def _extract_search_query(self, url: str) -> Optional[str]:
         """Extract search query from Google search URL."""
         try:
             if "google.com/search" in url:
-                # Extract query parameter
-                match = re.search(r"[?&]q=([^&]+)", url)
-                if match:
-                    return match.group(1).replace("+", " ")
+                # parse_qs decodes both "+" and percent escapes such as %20
+                values = parse_qs(urlparse(url).query).get("q")
+                if values:
+                    return values[0]
             return None
         except Exception as e:
             self.logger.error(f"Failed to extract search query: {str(e)}")
@@ -247,30 +307,29 @@ class GoogleScraper(BaseScraper):
             return
 
         try:
-            current_results = 0
-            last_height = self.driver.execute_script(
-                "return document.body.scrollHeight"
+            # No scrolling at all when the first page already has enough results
+            last_height, current_results = self.driver.execute_script(
+                _RESULTS_STATE_JS
             )
 
+            def page_grew(driver):
+                state = driver.execute_script(_RESULTS_STATE_JS)
+                return state if state[0] != last_height else False
+
             while current_results < max_results:
                 # Scroll down
                 self.driver.execute_script(
                     "window.scrollTo(0, document.body.scrollHeight);"
                 )
-                time.sleep(2)
-
-                # Count current results
-                current_results = len(
-                    self.driver.find_elements(By.CSS_SELECTOR, "div.g")
-                )
 
-                # Check if we've reached the bottom
-                new_height = self.driver.execute_script(
-                    "return document.body.scrollHeight"
-                )
-                if new_height == last_height:
+                # Poll until the page grows with the next results; if it
+                # does not within the old 2 second budget we are at the bottom
+                try:
+                    last_height, current_results = WebDriverWait(
+                        self.driver, 2, poll_frequency=0.2
+                    ).until(page_grew)
+                except TimeoutException:
                     break
-                last_height = new_height
 
                 if current_results >= max_results:
                     break
@@ -286,44 +345,15 @@ class GoogleScraper(BaseScraper):
 
         try:
             results = []
-            result_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.g")
-
-            for element in result_elements[:max_results]:
-                try:
-                    # Extract title
-                    title_element = element.find_element(By.CSS_SELECTOR, "h3")
-                    title = title_element.text if title_element else ""
+            raw_results = self.driver.execute_script(_SEARCH_RESULTS_JS, max_results)
 
-                    # Extract URL
-                    link_element = element.find_element(By.CSS_SELECTOR, "a")
-                    url = link_element.get_attribute("href") if link_element else ""
-
-                    # Extract snippet
-                    snippet_element = element.find_element(
-                        By.CSS_SELECTOR, "div.VwiC3b"
-                    )
-                    snippet = snippet_element.text if snippet_element else ""
-
-                    # Extract author/source (from URL)
-                    if url:
-                        author = self._extract_domain_from_url(url)
-                    else:
-                        author = "Unknown"
-
-                    results.append(
-                        {
-                            "title": title,
-                            "url": url or "",
-                            "snippet": snippet,
-                            "author": author,
-                        }
-                    )
-
-                except Exception as e:
+            for result in raw_results:
+                if result is None:
                     self.logger.warning(
-                        f"Failed to extract individual result: {str(e)}"
+                        "Failed to extract individual result: missing title, link or snippet"
                     )
                     continue
+                results.append(result)
 
             return results
 
@@ -334,10 +364,7 @@ class GoogleScraper(BaseScraper):
     def _extract_domain_from_url(self, url: str) -> str:
         """Extract domain name from URL."""
         try:
-            import urllib.parse
-
-            parsed = urllib.parse.urlparse(url)
-            return parsed.netloc.replace("www.", "")
+            return urlparse(url).netloc.removeprefix("www.") or "Unknown"
         except Exception:
             return "Unknown"
 
@@ -378,14 +405,36 @@ class GoogleScraper(BaseScraper):
         return self.scrape_content(target_url, max_posts)
 
     def save_posts_to_database(self, posts: List[ScrapedContent]) -> int:
-        """Save scraped posts to the database using DatabaseManager."""
+        """Save scraped posts to the database using DatabaseManager.
+
+        Results are mapped straight onto the posts table columns and written
+        in one batched transaction. Rows are keyed on the search query plus
+        the URL, so a page returned for several queries is stored once per
+        query.
+        """
         if not posts:
             return 0
 
-        # Convert ScrapedContent objects to dictionaries
-        posts_data = []
+        rows = []
         for post in posts:
-            posts_data.append({
+            search_query = (post.metadata or {}).get("search_query")
+            rows.append(
+                {
+                    "post_id": f"{search_query or ''}|{post.url}" if post.url else None,
+                    "author": self._extract_domain_from_url(post.url) if post.url else None,
+                    "content": post.content,
+                    "post_url": post.url,
+                    "group_name": search_query,
+                    "scraped_at": post.scraped_at,
+                }
+            )
+
+        return self.db_manager.save_posts(rows, self.batch_size)
+
+    def _serialize_results(self, posts: List[ScrapedContent]) -> List[Dict[str, Any]]:
+        """Convert results to the plain dicts written by save_posts_to_json."""
+        return [
+            {
                 'content': post.content,
                 'url': post.url,
                 'scraped_at': post.scraped_at,
@@ -393,28 +442,22 @@ class GoogleScraper(BaseScraper):
                 'snippet': getattr(post, 'snippet', ''),
                 'position': getattr(post, 'position', 0),
                 'metadata': post.metadata or {}
-            })
-
-        return self.db_manager.save_posts(posts_data)
+            }
+            for post in posts
+        ]
 
     def save_posts_to_json(self, posts: List[ScrapedContent], filename: str = "google_search_results.json") -> bool:
         """Save scraped posts to a JSON file."""
         try:
-            posts_data = []
-            for post in posts:
-                posts_data.append({
-                    'content': post.content,
-                    'url': post.url,
-                    'scraped_at': post.scraped_at,
-                    'title': getattr(post, 'title', ''),
-                    'snippet': getattr(post, 'snippet', ''),
-                    'position': getattr(post, 'position', 0),
-                    'metadata': post.metadata or {}
-                })
-
-            import json
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(posts_data, f, indent=2, ensure_ascii=False)
+            posts_data = self._serialize_results(posts)
+
+            if orjson is not None:
+                # Serialized in C straight to UTF-8 bytes, written in one call
+                with open(filename, "wb") as f:
+                    f.write(orjson.dumps(posts_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, "w", encoding="utf-8") as f:
+                    json.dump(posts_data, f, indent=2, ensure_ascii=False)
 
             self.logger.info(f"Saved {len(posts)} search results to {filename}")
             return True
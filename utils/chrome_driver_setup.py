@@ -4,14 +4,20 @@ Chrome Driver Setup for macOS
 Handles ChromeDriver setup and management for Selenium WebDriver.
 """
 
+import glob
+import logging
 import os
 import platform
+import random
+import re
+import shutil
+import stat
+import subprocess
+from functools import lru_cache
 from typing import Callable, Optional
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from fake_useragent import UserAgent
 
 # Import config to get the correct paths
 try:
@@ -32,19 +38,180 @@ except ImportError:
         return None
 
 
+def _create_logger() -> logging.Logger:
+    """Create the module logger, with a console handler if none is configured."""
+    logger = logging.getLogger(__name__)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+    return logger
+
+
+logger = _create_logger()
+
+# Flags every driver starts with
+_BASE_FLAGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1920,1080",
+    "--disable-blink-features=AutomationControlled",
+)
+
+# Profile-related flags for better session persistence
+_PROFILE_FLAGS = (
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+)
+
+# Extra flags for headless runs that skip background services and their
+# network requests. --single-process and --no-zygote are left out: they crash
+# Chrome with persistent profiles and DevTools sessions, which the scrapers use.
+_HEADLESS_STARTUP_FLAGS = (
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-domain-reliability",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+)
+
+# Recent Chrome on macOS user agents, matching the browser this module drives
+_USER_AGENTS = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+)
+
+# HTTP disk cache size for profile runs, in bytes
+_DISK_CACHE_SIZE = 512 * 1024 * 1024
+
+# Common macOS ChromeDriver locations, in priority order
+_COMMON_DRIVER_PATHS = (
+    # Priority: Downloads directory (same as config)
+    os.path.expanduser("~/Downloads/chromedriver-mac-arm64/chromedriver"),
+    os.path.expanduser("~/Downloads/chromedriver-mac-x64/chromedriver"),
+    os.path.expanduser("~/Downloads/chromedriver"),
+    # System locations
+    "/usr/local/bin/chromedriver",
+    "/opt/homebrew/bin/chromedriver",
+    "/usr/bin/chromedriver",
+    os.path.expanduser("~/chromedriver"),
+    "/Applications/chromedriver",
+)
+
+# Chrome version number in `chrome --version` output
+_VERSION_RE = re.compile(r"(\d+\.\d+\.\d+\.\d+)")
+
+# Version of the system Chrome, written by Chrome on every start
+_LAST_VERSION_FILE = os.path.expanduser(
+    "~/Library/Application Support/Google/Chrome/Last Version"
+)
+
+# `chrome --version` returns well within a second when Chrome works at all
+_VERSION_TIMEOUT = 3
+
+
+@lru_cache(maxsize=1)
+def _cached_driver_path() -> Optional[str]:
+    """
+    Get the configured ChromeDriver path, looked up once per process.
+
+    The lookup stats every configured candidate (and shells out to ``which``
+    for missing ones), so it is not repeated for every driver created.
+
+    Returns:
+        str: ChromeDriver path, or None if none is configured
+    """
+    return find_chrome_driver()
+
+
+@lru_cache(maxsize=1)
+def _cached_binary_path() -> Optional[str]:
+    """
+    Get the configured Chrome binary path, looked up once per process.
+
+    Returns:
+        str: Chrome binary path, or None if none is configured
+    """
+    return find_chrome_binary()
+
+
+def _ensure_executable(path: str) -> bool:
+    """
+    Check that a ChromeDriver file exists and make it executable if needed.
+
+    A single stat answers both questions; chmod only runs when the owner
+    execute bit is missing.
+
+    Args:
+        path (str): Candidate ChromeDriver path
+
+    Returns:
+        bool: True if the file exists
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        return False
+    if not mode & stat.S_IXUSR:
+        try:
+            os.chmod(path, 0o755)
+        except OSError:
+            pass  # Let the driver start fail with a clearer error
+    return True
+
+
+@lru_cache(maxsize=1)
+def _cached_profile_path() -> Optional[str]:
+    """
+    Get the configured Chrome profile path, looked up once per process.
+
+    check_profile_status and the profile options of every driver use the
+    same result, so the candidate directories are only checked once.
+
+    Returns:
+        str: Chrome profile path, or None if none exists
+    """
+    return find_chrome_profile()
+
+
 class ChromeDriverSetup:
     """ChromeDriver setup and management for macOS."""
 
     def __init__(self):
-        self.ua = UserAgent()
         self.system = platform.system()
         self.machine = platform.machine()
+        self._chrome_version: Optional[str] = None
+        self._profile_status: Optional[dict] = None
 
         if self.system != "Darwin":
             raise RuntimeError("This ChromeDriver setup is designed for macOS only")
 
     def setup_driver(
-        self, headless: bool = True, enhance_options: Optional[Callable] = None
+        self,
+        headless: bool = True,
+        enhance_options: Optional[Callable] = None,
+        profile_dir: Optional[str] = None,
+        debug_port: Optional[int] = None,
+        load_images: bool = False,
     ) -> webdriver.Chrome:
         """
         Setup Chrome WebDriver with macOS-optimized configuration.
@@ -52,11 +219,16 @@ class ChromeDriverSetup:
         Args:
             headless (bool): Run in headless mode
             enhance_options (callable): Optional function to enhance Chrome options
+            profile_dir (str): Optional user data directory, overrides profile lookup
+            debug_port (int): Optional remote debugging port for this instance
+            load_images (bool): Download images; blocked by default to save bandwidth
 
         Returns:
             webdriver.Chrome: Configured Chrome WebDriver instance
         """
-        options = self._create_chrome_options(headless)
+        options = self._create_chrome_options(
+            headless, profile_dir, debug_port, load_images
+        )
 
         # Apply custom enhancements if provided
         if enhance_options:
@@ -70,67 +242,94 @@ class ChromeDriverSetup:
 
         return driver
 
-    def _create_chrome_options(self, headless: bool) -> Options:
+    def _create_chrome_options(
+        self,
+        headless: bool,
+        profile_dir: Optional[str] = None,
+        debug_port: Optional[int] = None,
+        load_images: bool = False,
+    ) -> Options:
         """Create Chrome options optimized for macOS."""
         options = Options()
 
         if headless:
-            options.add_argument("--headless")
+            options.add_argument("--headless=new")
+            # Background services a scraping session never uses
+            for flag in _HEADLESS_STARTUP_FLAGS:
+                options.add_argument(flag)
+
+        # A distinct port lets several Chrome instances run side by side
+        if debug_port:
+            options.add_argument(f"--remote-debugging-port={debug_port}")
+
+        # The images content setting below is not always honoured in headless
+        # mode; the Blink setting stops image requests there as well
+        if not load_images:
+            options.add_argument("--blink-settings=imagesEnabled=false")
 
         # macOS-specific options
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument(f"--user-agent={self.ua.random}")
+        for flag in _BASE_FLAGS:
+            options.add_argument(flag)
+        options.add_argument(f"--user-agent={random.choice(_USER_AGENTS)}")
 
         # macOS-specific preferences
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
 
         # Try to set Chrome binary location from config
-        chrome_binary = find_chrome_binary()
+        chrome_binary = _cached_binary_path()
         if chrome_binary and os.path.exists(chrome_binary):
             options.binary_location = chrome_binary
-            print(f"✅ Using Chrome binary from: {chrome_binary}")
+            logger.debug("✅ Using Chrome binary from: %s", chrome_binary)
 
         # Set up profile for persistent sessions
-        self._setup_profile_options(options)
+        self._setup_profile_options(options, profile_dir, load_images)
 
         return options
 
-    def _setup_profile_options(self, options: Options) -> None:
+    def _setup_profile_options(
+        self,
+        options: Options,
+        profile_dir: Optional[str] = None,
+        load_images: bool = False,
+    ) -> None:
         """Set up Chrome profile options for persistent sessions."""
         try:
-            profile_path = find_chrome_profile()
-            if profile_path and os.path.exists(profile_path):
+            profile_path = _cached_profile_path()
+            if profile_dir:
+                # Dedicated profile, e.g. one per parallel worker
+                os.makedirs(profile_dir, exist_ok=True)
+                options.add_argument(f"--user-data-dir={profile_dir}")
+                logger.debug("✅ Using dedicated Chrome profile: %s", profile_dir)
+            elif profile_path and os.path.exists(profile_path):
                 # Use existing profile directory
                 options.add_argument(f"--user-data-dir={os.path.dirname(profile_path)}")
                 options.add_argument(
                     f"--profile-directory={os.path.basename(profile_path)}"
                 )
-                print(f"✅ Using existing Chrome profile: {profile_path}")
+                logger.debug("✅ Using existing Chrome profile: %s", profile_path)
             else:
                 # Create a new profile directory in Downloads
                 new_profile_dir = os.path.expanduser(
                     "~/Downloads/chrome-mac-arm64/ChromeProfile"
                 )
-                if not os.path.exists(new_profile_dir):
-                    os.makedirs(new_profile_dir, exist_ok=True)
-                    print(f"✅ Created new Chrome profile directory: {new_profile_dir}")
+                # Create directly; an existing directory is the common case
+                try:
+                    os.makedirs(new_profile_dir)
+                    logger.info(f"✅ Created new Chrome profile directory: {new_profile_dir}")
+                except FileExistsError:
+                    pass
 
                 options.add_argument(f"--user-data-dir={new_profile_dir}")
-                print(f"✅ Using new Chrome profile: {new_profile_dir}")
+                logger.debug("✅ Using new Chrome profile: %s", new_profile_dir)
+
+            # The HTTP cache lives in the profile directory and so persists
+            # between runs; give it a fixed size instead of one scaled to free disk
+            options.add_argument(f"--disk-cache-size={_DISK_CACHE_SIZE}")
 
             # Additional profile-related options for better session persistence
-            options.add_argument("--no-first-run")
-            options.add_argument("--no-default-browser-check")
-            options.add_argument("--disable-background-timer-throttling")
-            options.add_argument("--disable-backgrounding-occluded-windows")
-            options.add_argument("--disable-renderer-backgrounding")
-            options.add_argument("--disable-features=TranslateUI")
-            options.add_argument("--disable-ipc-flooding-protection")
+            for flag in _PROFILE_FLAGS:
+                options.add_argument(flag)
 
             # Keep cookies and session data
             options.add_experimental_option(
@@ -138,7 +337,9 @@ class ChromeDriverSetup:
                 {
                     "profile.default_content_setting_values.notifications": 2,
                     "profile.default_content_settings.popups": 0,
-                    "profile.managed_default_content_settings.images": 2,
+                    "profile.managed_default_content_settings.images": (
+                        1 if load_images else 2
+                    ),
                     "profile.default_content_setting_values.media_stream": 2,
                     "profile.password_manager_enabled": False,
                     "profile.default_content_setting_values.geolocation": 2,
@@ -146,11 +347,20 @@ class ChromeDriverSetup:
             )
 
         except Exception as e:
-            print(f"⚠️ Failed to setup profile options: {str(e)}")
+            logger.warning(f"⚠️ Failed to setup profile options: {str(e)}")
             # Continue without profile if setup fails
 
-    def check_profile_status(self) -> dict:
-        """Check the status of Chrome profiles and return information."""
+    def check_profile_status(self, check_lock: bool = False) -> dict:
+        """
+        Check the status of Chrome profiles and return information.
+
+        Profile discovery runs once per instance. Waiting up to 5 seconds for
+        a locked profile is opt-in via ``check_lock``, since starting Chrome
+        reports a locked profile anyway; the lock state is never cached.
+        """
+        if self._profile_status is not None and not check_lock:
+            return dict(self._profile_status)
+
         try:
             profile_info = {
                 "existing_profile": None,
@@ -159,22 +369,23 @@ class ChromeDriverSetup:
             }
 
             # Check for existing profile
-            existing_profile = find_chrome_profile()
+            existing_profile = _cached_profile_path()
             if existing_profile and os.path.exists(existing_profile):
                 profile_info["existing_profile"] = existing_profile
                 profile_info["profile_status"] = "existing"
 
-                # Check if profile is locked
-                from utils.chrome_process_manager import ChromeProcessManager
+                logger.debug("✅ Found existing profile: %s", existing_profile)
 
-                process_manager = ChromeProcessManager()
-                is_unlocked = process_manager.wait_for_profile_unlock(
-                    existing_profile, max_wait=5
-                )
-                profile_info["profile_locked"] = not is_unlocked
+                if check_lock:
+                    # Check if profile is locked
+                    from utils.chrome_process_manager import ChromeProcessManager
 
-                print(f"✅ Found existing profile: {existing_profile}")
-                print(f"   Profile locked: {profile_info['profile_locked']}")
+                    process_manager = ChromeProcessManager()
+                    is_unlocked = process_manager.wait_for_profile_unlock(
+                        existing_profile, max_wait=5
+                    )
+                    profile_info["profile_locked"] = not is_unlocked
+                    logger.info(f"🔒 Profile locked: {profile_info['profile_locked']}")
             else:
                 # Check for new profile directory
                 new_profile_dir = os.path.expanduser(
@@ -183,15 +394,18 @@ class ChromeDriverSetup:
                 if os.path.exists(new_profile_dir):
                     profile_info["new_profile"] = new_profile_dir
                     profile_info["profile_status"] = "new"
-                    print(f"✅ Found new profile directory: {new_profile_dir}")
+                    logger.debug("✅ Found new profile directory: %s", new_profile_dir)
                 else:
                     profile_info["profile_status"] = "none"
-                    print("⚠️ No Chrome profile found")
+                    logger.warning("⚠️ No Chrome profile found")
 
+            # Cache the discovery only; the lock state can change at any time
+            self._profile_status = dict(profile_info)
+            self._profile_status.pop("profile_locked", None)
             return profile_info
 
         except Exception as e:
-            print(f"⚠️ Error checking profile status: {str(e)}")
+            logger.warning(f"⚠️ Error checking profile status: {str(e)}")
             return {"profile_status": "error", "error": str(e)}
 
     def _create_driver_with_fallback(
@@ -208,115 +422,179 @@ class ChromeDriverSetup:
         if system_driver:
             return system_driver
 
-        # Priority 3: Try webdriver-manager
-        webdriver_manager_driver = self._try_webdriver_manager(options)
-        if webdriver_manager_driver:
-            return webdriver_manager_driver
-
-        # Priority 4: Try common macOS locations
+        # Priority 3: Try common macOS locations
         common_driver = self._try_common_locations(options)
         if common_driver:
             return common_driver
 
+        # Priority 4: Try webdriver-manager, the only source that may need the network
+        webdriver_manager_driver = self._try_webdriver_manager(options)
+        if webdriver_manager_driver:
+            return webdriver_manager_driver
+
         return None
 
     def _try_config_chromedriver(self, options: Options) -> Optional[webdriver.Chrome]:
         """Try to use ChromeDriver from config file."""
         try:
-            driver_path = find_chrome_driver()
-            if driver_path and os.path.exists(driver_path):
-                # Ensure executable permissions
-                os.chmod(driver_path, 0o755)
+            driver_path = _cached_driver_path()
+            if driver_path and _ensure_executable(driver_path):
                 service = Service(driver_path)
-                driver = webdriver.Chrome(service=service, options=options)
-                print(f"✅ Using ChromeDriver from config: {driver_path}")
+                driver = webdriver.Chrome(
+                    service=service, options=options, keep_alive=True
+                )
+                logger.debug("✅ Using ChromeDriver from config: %s", driver_path)
                 return driver
         except Exception as e:
-            print(f"⚠️ Config ChromeDriver failed: {str(e)}")
+            logger.warning(f"⚠️ Config ChromeDriver failed: {str(e)}")
 
         return None
 
     def _try_system_chromedriver(self, options: Options) -> Optional[webdriver.Chrome]:
         """Try to use system ChromeDriver from PATH."""
+        # Resolve PATH up front instead of paying for a failed driver launch
+        driver_path = shutil.which("chromedriver")
+        if not driver_path:
+            logger.debug("⚠️ System ChromeDriver not found in PATH")
+            return None
+
         try:
-            service = Service("chromedriver")
-            driver = webdriver.Chrome(service=service, options=options)
-            print("✅ Using system ChromeDriver from PATH")
+            service = Service(driver_path)
+            driver = webdriver.Chrome(
+                service=service, options=options, keep_alive=True
+            )
+            logger.debug("✅ Using system ChromeDriver from PATH: %s", driver_path)
             return driver
         except Exception as e:
-            print(f"⚠️ System ChromeDriver failed: {str(e)}")
+            logger.warning(f"⚠️ System ChromeDriver failed: {str(e)}")
             return None
 
     def _try_webdriver_manager(self, options: Options) -> Optional[webdriver.Chrome]:
         """Try to use webdriver-manager."""
         try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
-            print("✅ Using webdriver-manager ChromeDriver")
-            return driver
+            driver_path = self._find_cached_webdriver_manager_driver()
+            if driver_path:
+                logger.debug("✅ Found cached webdriver-manager ChromeDriver: %s", driver_path)
+                try:
+                    return self._launch_webdriver_manager_driver(driver_path, options)
+                except Exception as e:
+                    # Most likely a stale driver after Chrome auto-updated to a
+                    # new major version; let webdriver-manager fetch a match
+                    logger.warning(
+                        f"⚠️ Cached webdriver-manager ChromeDriver failed, reinstalling: {str(e)}"
+                    )
+
+            # Only needed on this rare fallback path, so imported on demand
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            driver_path = ChromeDriverManager().install()
+            return self._launch_webdriver_manager_driver(driver_path, options)
         except Exception as e:
-            print(f"⚠️ webdriver-manager failed: {str(e)}")
+            logger.warning(f"⚠️ webdriver-manager failed: {str(e)}")
             return None
 
+    def _launch_webdriver_manager_driver(
+        self, driver_path: str, options: Options
+    ) -> webdriver.Chrome:
+        """Start Chrome with a webdriver-manager ChromeDriver."""
+        service = Service(driver_path)
+        driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
+        logger.debug("✅ Using webdriver-manager ChromeDriver: %s", driver_path)
+        return driver
+
+    def _find_cached_webdriver_manager_driver(self) -> Optional[str]:
+        """
+        Find a ChromeDriver already downloaded by webdriver-manager.
+
+        ChromeDriverManager().install() checks online for the latest release
+        on every call. A driver in ~/.wdm matching the installed Chrome's major
+        version is used directly instead.
+
+        Returns:
+            str: Path of the newest matching cached driver, or None
+        """
+        version = self.get_chrome_version()
+        if version == "Unknown":
+            return None
+
+        major = version.split(".", 1)[0]
+        pattern = os.path.expanduser(
+            f"~/.wdm/drivers/chromedriver/*/{major}.*/**/chromedriver"
+        )
+        candidates = sorted(glob.glob(pattern, recursive=True), reverse=True)
+        for path in candidates:
+            if _ensure_executable(path):
+                return path
+        return None
+
     def _try_common_locations(self, options: Options) -> Optional[webdriver.Chrome]:
         """Try common macOS ChromeDriver locations."""
-        common_paths = [
-            # Priority: Downloads directory (same as config)
-            os.path.expanduser("~/Downloads/chromedriver-mac-arm64/chromedriver"),
-            os.path.expanduser("~/Downloads/chromedriver-mac-x64/chromedriver"),
-            os.path.expanduser("~/Downloads/chromedriver"),
-            # System locations
-            "/usr/local/bin/chromedriver",
-            "/opt/homebrew/bin/chromedriver",
-            "/usr/bin/chromedriver",
-            os.path.expanduser("~/chromedriver"),
-            "/Applications/chromedriver",
-        ]
-
-        for path in common_paths:
-            if os.path.exists(path):
+        for path in _COMMON_DRIVER_PATHS:
+            if _ensure_executable(path):
                 try:
-                    # Ensure executable permissions
-                    os.chmod(path, 0o755)
                     service = Service(path)
-                    driver = webdriver.Chrome(service=service, options=options)
-                    print(f"✅ Using ChromeDriver from: {path}")
+                    driver = webdriver.Chrome(
+                        service=service, options=options, keep_alive=True
+                    )
+                    logger.debug("✅ Using ChromeDriver from: %s", path)
                     return driver
                 except Exception as e:
-                    print(f"⚠️ ChromeDriver at {path} failed: {str(e)}")
+                    logger.warning(f"⚠️ ChromeDriver at {path} failed: {str(e)}")
                     continue
 
         return None
 
     def get_chrome_version(self) -> str:
-        """Get Chrome version from system."""
-        try:
-            import subprocess
+        """Get Chrome version from system.
 
+        A detected version is remembered, so only the first call runs
+        ``chrome --version``.
+        """
+        if self._chrome_version is None:
+            version = self._detect_chrome_version()
+            if version == "Unknown":
+                return version
+            self._chrome_version = version
+        return self._chrome_version
+
+    def _detect_chrome_version(self) -> str:
+        """Run the Chrome binary to read its version."""
+        try:
             # First try to get version from config binary
-            chrome_binary = find_chrome_binary()
+            chrome_binary = _cached_binary_path()
             if chrome_binary and os.path.exists(chrome_binary):
                 try:
-                    print(
-                        f"🔍 Checking Chrome version from config binary: {chrome_binary}"
+                    logger.debug(
+                        "🔍 Checking Chrome version from config binary: %s", chrome_binary
                     )
                     result = subprocess.run(
                         [chrome_binary, "--version"],
                         capture_output=True,
                         text=True,
-                        timeout=10,
+                        timeout=_VERSION_TIMEOUT,
                     )
                     if result.returncode == 0:
                         version = result.stdout.strip()
-                        print(f"✅ Chrome version from config binary: {version}")
+                        logger.debug("✅ Chrome version from config binary: %s", version)
                         # Extract version number
-                        import re
-
-                        match = re.search(r"(\d+\.\d+\.\d+\.\d+)", version)
+                        match = _VERSION_RE.search(version)
                         if match:
                             return match.group(1)
                 except Exception as e:
-                    print(f"⚠️ Failed to get version from config binary: {str(e)}")
+                    logger.warning(f"⚠️ Failed to get version from config binary: {str(e)}")
+
+            # System Chrome records its version in its user data directory;
+            # reading it avoids starting Chrome just to print the version
+            try:
+                with open(_LAST_VERSION_FILE, encoding="utf-8") as f:
+                    match = _VERSION_RE.fullmatch(f.read().strip())
+                if match:
+                    logger.debug(
+                        "✅ Chrome version from %s: %s", _LAST_VERSION_FILE, match.group(1)
+                    )
+                    return match.group(1)
+            except OSError:
+                pass
 
             # macOS Chrome locations as fallback
             chrome_paths = [
@@ -330,30 +608,28 @@ class ChromeDriverSetup:
             for chrome_path in chrome_paths:
                 if os.path.exists(chrome_path):
                     try:
-                        print(f"🔍 Checking Chrome version from: {chrome_path}")
+                        logger.debug("🔍 Checking Chrome version from: %s", chrome_path)
                         result = subprocess.run(
                             [chrome_path, "--version"],
                             capture_output=True,
                             text=True,
-                            timeout=10,
+                            timeout=_VERSION_TIMEOUT,
                         )
                         if result.returncode == 0:
                             version = result.stdout.strip()
-                            print(f"✅ Chrome version from system: {version}")
+                            logger.debug("✅ Chrome version from system: %s", version)
                             # Extract version number
-                            import re
-
-                            match = re.search(r"(\d+\.\d+\.\d+\.\d+)", version)
+                            match = _VERSION_RE.search(version)
                             if match:
                                 return match.group(1)
                     except Exception as e:
-                        print(f"⚠️ Failed to get version from {chrome_path}: {str(e)}")
+                        logger.warning(f"⚠️ Failed to get version from {chrome_path}: {str(e)}")
                         continue
 
             return "Unknown"
 
         except Exception as e:
-            print(f"Error getting Chrome version: {str(e)}")
+            logger.error(f"❌ Error getting Chrome version: {str(e)}")
             return "Unknown"
 
     def verify_config_paths(self) -> dict:
@@ -372,30 +648,19 @@ class ChromeDriverSetup:
             },
         }
 
-        # Check ChromeDriver
-        driver_path = verification["chrome_driver"]["path"]
-        if driver_path:
-            verification["chrome_driver"]["exists"] = os.path.exists(driver_path)
-            if verification["chrome_driver"]["exists"]:
-                verification["chrome_driver"]["executable"] = os.access(
-                    driver_path, os.X_OK
-                )
-                try:
-                    stat = os.stat(driver_path)
-                    verification["chrome_driver"]["permissions"] = oct(stat.st_mode)[
-                        -3:
-                    ]
-                except Exception:
-                    verification["chrome_driver"]["permissions"] = "Unknown"
-
-        # Check Chrome binary
-        binary_path = verification["chrome_binary"]["path"]
-        if binary_path:
-            verification["chrome_binary"]["exists"] = os.path.exists(binary_path)
-            if verification["chrome_binary"]["exists"]:
-                verification["chrome_binary"]["executable"] = os.access(
-                    binary_path, os.X_OK
-                )
+        # One stat per file gives existence, execute bits and permissions
+        for key in ("chrome_driver", "chrome_binary"):
+            info = verification[key]
+            if not info["path"]:
+                continue
+            try:
+                mode = os.stat(info["path"]).st_mode
+            except OSError:
+                continue
+            info["exists"] = True
+            info["executable"] = bool(mode & 0o111)
+            if "permissions" in info:
+                info["permissions"] = oct(mode)[-3:]
 
         return verification
 
@@ -410,10 +675,24 @@ class ChromeDriverSetup:
             "config_chrome_driver": find_chrome_driver(),
             "config_chrome_binary": find_chrome_binary(),
             "path_verification": self.verify_config_paths(),
-            "profile_status": self.check_profile_status(),
+            "profile_status": self.check_profile_status(check_lock=True),
         }
 
 
+@lru_cache(maxsize=1)
+def get_chrome_driver_setup() -> ChromeDriverSetup:
+    """
+    Get a shared ChromeDriverSetup instance.
+
+    The setup object holds no per-driver state, so one instance can serve
+    every scraper, including parallel workers.
+
+    Returns:
+        ChromeDriverSetup: Shared setup instance
+    """
+    return ChromeDriverSetup()
+
+
 def create_chrome_driver(
     headless: bool = True, enhance_options: Optional[Callable] = None
 ) -> webdriver.Chrome:
@@ -427,7 +706,7 @@ def create_chrome_driver(
     Returns:
         webdriver.Chrome: Configured Chrome WebDriver instance
     """
-    setup = ChromeDriverSetup()
+    setup = get_chrome_driver_setup()
     return setup.setup_driver(headless, enhance_options)
 
 
@@ -444,25 +723,25 @@ def create_chrome_driver_with_profile(
     Returns:
         webdriver.Chrome: Configured Chrome WebDriver instance with profile
     """
-    setup = ChromeDriverSetup()
+    setup = get_chrome_driver_setup()
 
     # Check profile status first
     profile_info = setup.check_profile_status()
-    print(f"📊 Profile Status: {profile_info['profile_status']}")
+    logger.info(f"📊 Profile Status: {profile_info['profile_status']}")
 
     # Create driver with profile options
     driver = setup.setup_driver(headless)
 
     if driver:
-        print("✅ Chrome driver created successfully with profile management")
-        print("🔐 Your Facebook login session should persist between runs!")
+        logger.info("✅ Chrome driver created successfully with profile management")
+        logger.info("🔐 Your Facebook login session should persist between runs!")
     else:
-        print("❌ Failed to create Chrome driver with profile")
+        logger.error("❌ Failed to create Chrome driver with profile")
 
     return driver
 
 
 def get_chrome_info() -> dict:
     """Get Chrome and system information."""
-    setup = ChromeDriverSetup()
+    setup = get_chrome_driver_setup()
     return setup.get_system_info()
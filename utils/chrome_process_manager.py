@@ -7,11 +7,218 @@ This module provides clean separation of concerns for Chrome process operations.
 """
 
 import os
+import sys
 import time
 import logging
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
 import psutil
 
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # Optional; profile unlock falls back to polling
+    INotify = None
+
+
+@lru_cache(maxsize=4096)
+def _is_selenium_cmdline(
+    cmdline: Tuple[str, ...], indicators: FrozenSet[str]
+) -> bool:
+    """Classify a Chrome command line, memoized across process scans.
+
+    The same Chrome processes are seen on every scan (cleanup scans the
+    process table before and after terminating), so repeated command lines
+    are answered from the cache. The indicator set is part of the key, so
+    changing the indicator list invalidates earlier results.
+
+    Args:
+        cmdline: Command line arguments of the process
+        indicators: Selenium indicators, matched against whole arguments
+
+    Returns:
+        bool: True if Selenium-related, False otherwise
+    """
+    for arg in cmdline:
+        # Indicators match a whole argument ("--disable-features=TranslateUI")
+        # or its switch name ("--user-data-dir" for "--user-data-dir=/tmp/x")
+        switch = arg.split("=", 1)[0]
+        if arg in indicators or switch in indicators:
+            return True
+
+        # Also check for remote debugging port (common Selenium indicator)
+        if switch == "--remote-debugging-port":
+            return True
+
+    return False
+
+
+# Upper bound on threads used to signal processes during cleanup
+_SIGNAL_WORKERS = 16
+
+
+def _terminate_process(proc: psutil.Process) -> Optional[int]:
+    """Send SIGTERM to a process.
+
+    Returns:
+        Optional[int]: PID of the process, or None if it could not be signalled
+    """
+    try:
+        proc.terminate()
+        return proc.info["pid"]
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+
+def _kill_process(proc: psutil.Process) -> Optional[int]:
+    """Send SIGKILL to a process.
+
+    No is_running() check first: kill() already raises NoSuchProcess for a
+    process that has exited, and refuses to signal a reused PID.
+
+    Returns:
+        Optional[int]: PID of the process, or None if it was gone or protected
+    """
+    try:
+        proc.kill()
+        return proc.info["pid"]
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+
+def _signal_processes(processes: List[psutil.Process], signal_func) -> List[int]:
+    """Apply signal_func to processes concurrently.
+
+    Each call is a separate syscall that releases the GIL, so a pool turns N
+    sequential round trips into a few parallel ones.
+
+    Returns:
+        List[int]: PIDs that were signalled successfully
+    """
+    if not processes:
+        return []
+    workers = min(_SIGNAL_WORKERS, len(processes))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [pid for pid in executor.map(signal_func, processes) if pid is not None]
+
+
+# Lowercased process names of ChromeDriver and of Chrome/Chromium browsers
+# (Linux truncates names to 15 characters, hence "chromium-browse")
+_DRIVER_NAMES = frozenset({"chromedriver", "chromedriver.exe"})
+_CHROME_NAMES = frozenset(
+    {
+        "chrome",
+        "chrome.exe",
+        "chromium",
+        "chromium-browse",
+        "chromium-browser",
+        "google-chrome",
+        "google chrome",
+    }
+)
+# macOS names each helper process, e.g. "Google Chrome Helper (Renderer)"
+_CHROME_HELPER_PREFIXES = ("google chrome helper", "chromium helper")
+
+
+def _chrome_name_kind(name: str) -> Optional[str]:
+    """Classify a process name as ChromeDriver, Chrome or neither.
+
+    Most process names are already lowercase, so they are looked up without
+    allocating a lowercased copy.
+
+    Returns:
+        Optional[str]: "chromedriver", "chrome", or None for other processes
+    """
+    if not name.islower():
+        name = name.lower()
+    if name in _DRIVER_NAMES:
+        return "chromedriver"
+    if name in _CHROME_NAMES or name.startswith(_CHROME_HELPER_PREFIXES):
+        return "chrome"
+    return None
+
+
+# How long a process scan is reused by back-to-back calls, in seconds
+_SCAN_CACHE_TTL = 0.5
+
+# Linux exposes process names and command lines as small files under /proc,
+# which are much cheaper to read than building a psutil.Process per PID
+_USE_PROC_FS = sys.platform.startswith("linux") and os.path.isdir("/proc")
+
+
+def _iter_proc_chrome_processes() -> Iterator[Tuple[str, psutil.Process]]:
+    """Yield Chrome-named processes by reading /proc directly (Linux only).
+
+    Only /proc/<pid>/comm is read for every PID; a psutil.Process is created
+    for Chrome processes alone, so they can still be signalled safely.
+
+    Yields:
+        Tuples of name kind ("chromedriver" or "chrome") and the process,
+        whose ``info`` holds pid, name, cmdline and create_time
+    """
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/comm", encoding="utf-8", errors="replace") as f:
+                name = f.read().rstrip("\n")
+            kind = _chrome_name_kind(name)
+            if kind is None:
+                continue
+
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                data = f.read()
+            # Chrome helpers rewrite their argv as one space-separated string,
+            # with or without a trailing NUL; split it like psutil does
+            sep = b"\0" if data.endswith(b"\0") else b" "
+            args = [arg for arg in data.split(sep) if arg]
+            if sep == b"\0" and len(args) == 1 and b" " in args[0]:
+                args = [arg for arg in args[0].split(b" ") if arg]
+            cmdline = [os.fsdecode(arg) for arg in args]
+
+            proc = psutil.Process(int(pid))
+            proc.info = {
+                "pid": proc.pid,
+                "name": name,
+                "cmdline": cmdline,
+                "create_time": proc.create_time(),
+            }
+        except (OSError, psutil.NoSuchProcess, psutil.AccessDenied):
+            # The process exited or is not readable
+            continue
+        yield kind, proc
+
+
+def _iter_psutil_chrome_processes() -> Iterator[Tuple[str, psutil.Process]]:
+    """Yield Chrome-named processes through psutil.process_iter.
+
+    Yields:
+        Tuples of name kind ("chromedriver" or "chrome") and the process,
+        whose ``info`` holds pid, name, cmdline and create_time
+    """
+    # Only the name is read for every process; the rest is fetched for
+    # Chrome processes alone
+    for proc in psutil.process_iter(["name"]):
+        try:
+            proc_name = proc.info["name"] or ""
+            kind = _chrome_name_kind(proc_name)
+            if kind is None:
+                continue
+
+            # Read the remaining attributes in one pass over /proc
+            with proc.oneshot():
+                proc.info["name"] = proc_name
+                proc.info["pid"] = proc.pid
+                proc.info["cmdline"] = proc.cmdline()
+                proc.info["create_time"] = proc.create_time()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+        yield kind, proc
+
+
+# "type" field reported by get_chrome_process_details for Chrome processes
+_CHROME_TYPES = {"selenium_chrome": "selenium", "regular_chrome": "regular"}
+
 
 class ChromeProcessManager:
     """Manages Chrome processes specifically related to Selenium/ChromeDriver automation."""
@@ -36,16 +243,31 @@ class ChromeProcessManager:
         "--disable-features=VizDisplayCompositor",
     ]
 
+    # Shared logger for instances created without one
+    _default_logger: Optional[logging.Logger] = None
+
+    # Frozen copy of the indicators for lookups, rebuilt when the list changes
+    _indicator_set: Optional[FrozenSet[str]] = None
+
     def __init__(self, logger: Optional[logging.Logger] = None):
         """Initialize the Chrome Process Manager.
 
         Args:
             logger: Optional logger instance. If None, creates a basic logger.
         """
-        self.logger = logger or self._create_default_logger()
+        self.logger = logger or type(self)._get_default_logger()
+        # Monotonic timestamp and result of the last process scan
+        self._scan_cache: Tuple[float, Optional[Dict[str, List[psutil.Process]]]] = (
+            0.0,
+            None,
+        )
+
+    @classmethod
+    def _get_default_logger(cls) -> logging.Logger:
+        """Get the default logger, configuring it on first use."""
+        if cls._default_logger is not None:
+            return cls._default_logger
 
-    def _create_default_logger(self) -> logging.Logger:
-        """Create a default logger if none provided."""
         logger = logging.getLogger(__name__)
         if not logger.handlers:
             handler = logging.StreamHandler()
@@ -55,6 +277,7 @@ class ChromeProcessManager:
             handler.setFormatter(formatter)
             logger.addHandler(handler)
             logger.setLevel(logging.INFO)
+        cls._default_logger = logger
         return logger
 
     def terminate_selenium_chrome_sessions(self) -> bool:
@@ -64,45 +287,27 @@ class ChromeProcessManager:
             bool: True if successful, False otherwise
         """
         try:
-            # Log current process details before cleanup
-            self.logger.info("Current Chrome process status before cleanup:")
-            process_details = self.get_chrome_process_details()
-
-            for proc_type, processes in process_details.items():
-                if processes:
-                    self.logger.info(f"  {proc_type}: {len(processes)} processes")
-                    for proc in processes[:3]:  # Show first 3 processes
-                        self.logger.info(f"    PID {proc['pid']}: {proc['name']}")
-                    if len(processes) > 3:
-                        self.logger.info(f"    ... and {len(processes) - 3} more")
-                else:
-                    self.logger.info(f"  {proc_type}: 0 processes")
-
-            # Find and terminate only Chrome processes related to Selenium/ChromeDriver
-            selenium_chrome_processes = []
-            chromedriver_processes = []
-
-            for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-                try:
-                    proc_name = proc.info["name"].lower()
-                    cmdline = proc.info.get("cmdline", [])
-
-                    # Check for ChromeDriver processes
-                    if "chromedriver" in proc_name:
-                        chromedriver_processes.append(proc)
-                        continue
-
-                    # Check for Chrome processes that are likely from Selenium
-                    if "chrome" in proc_name:
-                        if self._is_selenium_chrome_process(cmdline):
-                            selenium_chrome_processes.append(proc)
-
-                except (
-                    psutil.NoSuchProcess,
-                    psutil.AccessDenied,
-                    psutil.ZombieProcess,
-                ):
-                    continue
+            # One scan serves both the status log and the termination list
+            processes_before = self._scan()
+            log_status = self.logger.isEnabledFor(logging.INFO)
+
+            if log_status:
+                self.logger.info("Current Chrome process status before cleanup:")
+                for proc_type, processes in processes_before.items():
+                    if processes:
+                        self.logger.info(f"  {proc_type}: {len(processes)} processes")
+                        for proc in processes[:3]:  # Show first 3 processes
+                            self.logger.info(
+                                f"    PID {proc.info['pid']}: {proc.info['name']}"
+                            )
+                        if len(processes) > 3:
+                            self.logger.info(f"    ... and {len(processes) - 3} more")
+                    else:
+                        self.logger.info(f"  {proc_type}: 0 processes")
+
+            # Terminate only Chrome processes related to Selenium/ChromeDriver
+            selenium_chrome_processes = processes_before["selenium_chrome"]
+            chromedriver_processes = processes_before["chromedriver"]
 
             total_selenium_processes = len(selenium_chrome_processes) + len(
                 chromedriver_processes
@@ -114,50 +319,57 @@ class ChromeProcessManager:
                 )
 
                 # Terminate ChromeDriver processes first
-                for proc in chromedriver_processes:
-                    try:
-                        proc.terminate()
-                        self.logger.info(
-                            f"Terminated ChromeDriver process: PID {proc.info['pid']}"
-                        )
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
+                terminated = _signal_processes(chromedriver_processes, _terminate_process)
+                if terminated:
+                    self.logger.info(
+                        "Terminated %d ChromeDriver processes: PIDs %s",
+                        len(terminated),
+                        terminated,
+                    )
 
                 # Terminate Selenium Chrome processes
-                for proc in selenium_chrome_processes:
-                    try:
-                        proc.terminate()
-                        self.logger.info(
-                            f"Terminated Selenium Chrome process: PID {proc.info['pid']}"
-                        )
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
-
-                # Wait a bit for processes to terminate
-                time.sleep(2)
+                terminated = _signal_processes(
+                    selenium_chrome_processes, _terminate_process
+                )
+                if terminated:
+                    self.logger.info(
+                        "Terminated %d Selenium Chrome processes: PIDs %s",
+                        len(terminated),
+                        terminated,
+                    )
+
+                # Wait up to 2s for processes to exit, returning as soon as
+                # they are all gone
+                _, alive = psutil.wait_procs(
+                    chromedriver_processes + selenium_chrome_processes, timeout=2
+                )
 
                 # Force kill any remaining processes
-                for proc in chromedriver_processes + selenium_chrome_processes:
-                    try:
-                        if proc.is_running():
-                            proc.kill()
-                            self.logger.info(
-                                f"Force killed process: PID {proc.info['pid']}"
-                            )
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
+                killed = _signal_processes(alive, _kill_process)
+                if killed:
+                    self.logger.info(
+                        "Force killed %d processes: PIDs %s", len(killed), killed
+                    )
+                    psutil.wait_procs(alive, timeout=1)
 
                 self.logger.info("Selenium Chrome processes terminated successfully")
 
-                # Log process status after cleanup
-                self.logger.info("Chrome process status after cleanup:")
-                process_details_after = self.get_chrome_process_details()
+                # Drop cached scans that still list the processes just killed
+                self.clear_cache()
 
-                for proc_type, processes in process_details_after.items():
-                    if processes:
-                        self.logger.info(f"  {proc_type}: {len(processes)} processes")
-                    else:
-                        self.logger.info(f"  {proc_type}: 0 processes")
+                # The second scan only feeds the status log, so skip it when
+                # INFO messages would be discarded
+                if log_status:
+                    self.logger.info("Chrome process status after cleanup:")
+                    processes_after = self._scan(force=True)
+
+                    for proc_type, processes in processes_after.items():
+                        if processes:
+                            self.logger.info(
+                                f"  {proc_type}: {len(processes)} processes"
+                            )
+                        else:
+                            self.logger.info(f"  {proc_type}: 0 processes")
 
                 return True
             else:
@@ -180,27 +392,25 @@ class ChromeProcessManager:
             selenium_chrome_running = False
             chromedriver_running = False
 
-            for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-                try:
-                    proc_name = proc.info["name"].lower()
-                    cmdline = proc.info.get("cmdline", [])
-
-                    # Check for ChromeDriver processes
-                    if "chromedriver" in proc_name:
-                        chromedriver_running = True
-                        continue
-
-                    # Check for Chrome processes that are likely from Selenium
-                    if "chrome" in proc_name:
-                        if self._is_selenium_chrome_process(cmdline):
-                            selenium_chrome_running = True
+            # Reuse a fresh scan if there is one; otherwise stop scanning as
+            # soon as both kinds of process have been seen
+            cached = self._get_cached_scan()
+            if cached is not None:
+                found = (
+                    (proc_type, proc)
+                    for proc_type, processes in cached.items()
+                    for proc in processes
+                )
+            else:
+                found = self._iter_chrome_processes()
 
-                except (
-                    psutil.NoSuchProcess,
-                    psutil.AccessDenied,
-                    psutil.ZombieProcess,
-                ):
-                    continue
+            for proc_type, _ in found:
+                if proc_type == "chromedriver":
+                    chromedriver_running = True
+                elif proc_type == "selenium_chrome":
+                    selenium_chrome_running = True
+                if selenium_chrome_running and chromedriver_running:
+                    break
 
             if selenium_chrome_running:
                 self.logger.info("Selenium Chrome is currently running")
@@ -225,67 +435,96 @@ class ChromeProcessManager:
             Dict containing categorized Chrome processes
         """
         try:
-            selenium_chrome_processes = []
-            chromedriver_processes = []
-            regular_chrome_processes = []
-
-            for proc in psutil.process_iter(["pid", "name", "cmdline", "create_time"]):
-                try:
-                    proc_name = proc.info["name"].lower()
-                    cmdline = proc.info.get("cmdline", [])
-
-                    # Check for ChromeDriver processes
-                    if "chromedriver" in proc_name:
-                        chromedriver_processes.append(
-                            {
-                                "pid": proc.info["pid"],
-                                "name": proc.info["name"],
-                                "cmdline": cmdline,
-                                "create_time": proc.info["create_time"],
-                            }
-                        )
-                        continue
-
-                    # Check for Chrome processes
-                    if "chrome" in proc_name:
-                        if self._is_selenium_chrome_process(cmdline):
-                            selenium_chrome_processes.append(
-                                {
-                                    "pid": proc.info["pid"],
-                                    "name": proc.info["name"],
-                                    "cmdline": cmdline,
-                                    "create_time": proc.info["create_time"],
-                                    "type": "selenium",
-                                }
-                            )
-                        else:
-                            regular_chrome_processes.append(
-                                {
-                                    "pid": proc.info["pid"],
-                                    "name": proc.info["name"],
-                                    "cmdline": cmdline,
-                                    "create_time": proc.info["create_time"],
-                                    "type": "regular",
-                                }
-                            )
-
-                except (
-                    psutil.NoSuchProcess,
-                    psutil.AccessDenied,
-                    psutil.ZombieProcess,
-                ):
-                    continue
-
-            return {
-                "selenium_chrome": selenium_chrome_processes,
-                "chromedriver": chromedriver_processes,
-                "regular_chrome": regular_chrome_processes,
-            }
+            details: Dict[str, List[Dict[str, Any]]] = {}
+            for proc_type, processes in self._scan().items():
+                details[proc_type] = []
+                for proc in processes:
+                    info = {
+                        "pid": proc.info["pid"],
+                        "name": proc.info["name"],
+                        "cmdline": proc.info["cmdline"],
+                        "create_time": proc.info["create_time"],
+                    }
+                    if proc_type != "chromedriver":
+                        info["type"] = _CHROME_TYPES[proc_type]
+                    details[proc_type].append(info)
+            return details
 
         except Exception as e:
             self.logger.warning(f"Error getting Chrome process details: {str(e)}")
             return {"selenium_chrome": [], "chromedriver": [], "regular_chrome": []}
 
+    def _scan(self, force: bool = False) -> Dict[str, List[psutil.Process]]:
+        """Scan the process table once and categorize Chrome processes.
+
+        A scan younger than _SCAN_CACHE_TTL is reused, so a status check
+        followed by a cleanup walks the process table only once.
+
+        Args:
+            force: Rescan even if a recent result is cached
+
+        Returns:
+            Dict mapping "selenium_chrome", "chromedriver" and "regular_chrome"
+            to processes whose ``info`` holds pid, name, cmdline and create_time
+        """
+        if not force:
+            cached = self._get_cached_scan()
+            if cached is not None:
+                return cached
+
+        processes: Dict[str, List[psutil.Process]] = {
+            "selenium_chrome": [],
+            "chromedriver": [],
+            "regular_chrome": [],
+        }
+        for proc_type, proc in self._iter_chrome_processes():
+            processes[proc_type].append(proc)
+        self._scan_cache = (time.monotonic(), processes)
+        return processes
+
+    def _get_cached_scan(self) -> Optional[Dict[str, List[psutil.Process]]]:
+        """Return the last scan if it is younger than _SCAN_CACHE_TTL."""
+        timestamp, processes = self._scan_cache
+        if processes is not None and time.monotonic() - timestamp < _SCAN_CACHE_TTL:
+            return processes
+        return None
+
+    def clear_cache(self):
+        """Discard cached process information so the next scan is fresh."""
+        self._scan_cache = (0.0, None)
+        # psutil 6 also caches the processes process_iter returns
+        cache_clear = getattr(psutil.process_iter, "cache_clear", None)
+        if cache_clear is not None:
+            cache_clear()
+
+    def _iter_chrome_processes(self) -> Iterator[Tuple[str, psutil.Process]]:
+        """Yield each Chrome-related process with its category.
+
+        Yields:
+            Tuples of category ("selenium_chrome", "chromedriver" or
+            "regular_chrome") and the process
+        """
+        if _USE_PROC_FS:
+            processes = _iter_proc_chrome_processes()
+        else:
+            processes = _iter_psutil_chrome_processes()
+
+        # Resolved once per scan rather than once per process
+        indicators = self._get_indicator_set()
+
+        for kind, proc in processes:
+            # Check for ChromeDriver processes
+            if kind == "chromedriver":
+                yield "chromedriver", proc
+                continue
+
+            # Check for Chrome processes that are likely from Selenium
+            cmdline = proc.info["cmdline"]
+            if cmdline and _is_selenium_cmdline(tuple(cmdline), indicators):
+                yield "selenium_chrome", proc
+            else:
+                yield "regular_chrome", proc
+
     def _is_selenium_chrome_process(self, cmdline: List[str]) -> bool:
         """Check if a Chrome process is Selenium-related based on command line arguments.
 
@@ -298,16 +537,7 @@ class ChromeProcessManager:
         if not cmdline:
             return False
 
-        # Check if this Chrome process has Selenium-specific arguments
-        is_selenium_chrome = any(
-            indicator in " ".join(cmdline)
-            for indicator in self.SELENIUM_CHROME_INDICATORS
-        )
-
-        # Also check for remote debugging port (common Selenium indicator)
-        has_remote_debug = any("--remote-debugging-port" in arg for arg in cmdline)
-
-        return is_selenium_chrome or has_remote_debug
+        return _is_selenium_cmdline(tuple(cmdline), self._get_indicator_set())
 
     def wait_for_profile_unlock(self, profile_dir: str, max_wait: int = 10) -> bool:
         """Wait for the profile directory to be unlocked by checking for lock files.
@@ -327,35 +557,100 @@ class ChromeProcessManager:
                 os.path.join(profile_dir, ".lock"),
             ]
 
-            start_time = time.time()
-            while time.time() - start_time < max_wait:
-                locked = False
-                for lock_file in lock_files:
-                    if os.path.exists(lock_file):
-                        try:
-                            # Try to remove the lock file
-                            os.remove(lock_file)
-                            self.logger.info(f"Removed lock file: {lock_file}")
-                        except (OSError, PermissionError):
-                            locked = True
-                            break
-
-                if not locked:
-                    self.logger.info("Profile directory is unlocked")
-                    return True
-
-                self.logger.info("Profile directory is locked, waiting...")
-                time.sleep(1)
-
-            self.logger.warning(
-                f"Profile directory still locked after {max_wait} seconds"
-            )
-            return False
+            watcher = self._watch_lock_files(lock_files)
+            try:
+                return self._poll_profile_unlock(lock_files, max_wait, watcher)
+            finally:
+                if watcher is not None:
+                    watcher.close()
 
         except Exception as e:
             self.logger.warning(f"Error checking profile lock status: {str(e)}")
             return False
 
+    def _poll_profile_unlock(
+        self, lock_files: List[str], max_wait: int, watcher: Optional[Any]
+    ) -> bool:
+        """Remove lock files, waiting between attempts until max_wait expires.
+
+        Args:
+            lock_files: Lock file paths to remove
+            max_wait: Maximum time to wait in seconds
+            watcher: inotify instance watching the lock file directories, or
+                None to poll once per second
+
+        Returns:
+            bool: True if unlocked, False if still locked after timeout
+        """
+        deadline = time.monotonic() + max_wait
+        while True:
+            locked = False
+            for lock_file in lock_files:
+                if os.path.exists(lock_file):
+                    try:
+                        # Try to remove the lock file
+                        os.remove(lock_file)
+                        self.logger.info(f"Removed lock file: {lock_file}")
+                    except (OSError, PermissionError):
+                        locked = True
+                        break
+
+            if not locked:
+                self.logger.info("Profile directory is unlocked")
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            self.logger.info("Profile directory is locked, waiting...")
+            if watcher is not None:
+                # Wakes up as soon as an entry in a watched directory is
+                # deleted, instead of after a fixed interval
+                watcher.read(timeout=int(remaining * 1000))
+            else:
+                time.sleep(min(remaining, 1))
+
+        self.logger.warning(f"Profile directory still locked after {max_wait} seconds")
+        return False
+
+    def _watch_lock_files(self, lock_files: List[str]) -> Optional[Any]:
+        """Watch the lock files' directories for deletions, where supported.
+
+        Args:
+            lock_files: Lock file paths to watch
+
+        Returns:
+            An inotify instance, or None if inotify_simple is not installed
+            or the directories cannot be watched
+        """
+        if INotify is None:
+            return None
+
+        watcher = INotify()
+        try:
+            for directory in {os.path.dirname(path) for path in lock_files}:
+                if os.path.isdir(directory):
+                    watcher.add_watch(
+                        directory, inotify_flags.DELETE | inotify_flags.MOVED_FROM
+                    )
+        except OSError as e:
+            self.logger.debug("Falling back to polling for profile unlock: %s", e)
+            watcher.close()
+            return None
+        return watcher
+
+    @classmethod
+    def _get_indicator_set(cls) -> FrozenSet[str]:
+        """Get the Selenium indicators as a set for constant-time lookups.
+
+        Returns:
+            Frozen set of the current indicators
+        """
+        if cls._indicator_set is None:
+            cls._indicator_set = frozenset(cls.SELENIUM_CHROME_INDICATORS)
+        return cls._indicator_set
+
     @classmethod
     def add_selenium_indicator(cls, indicator: str) -> bool:
         """Add a new Selenium indicator to the list.
@@ -366,8 +661,9 @@ class ChromeProcessManager:
         Returns:
             bool: True if added, False if already exists
         """
-        if indicator not in cls.SELENIUM_CHROME_INDICATORS:
+        if indicator not in cls._get_indicator_set():
             cls.SELENIUM_CHROME_INDICATORS.append(indicator)
+            cls._indicator_set = None
             return True
         return False
 
@@ -381,8 +677,9 @@ class ChromeProcessManager:
         Returns:
             bool: True if removed, False if not found
         """
-        if indicator in cls.SELENIUM_CHROME_INDICATORS:
+        if indicator in cls._get_indicator_set():
             cls.SELENIUM_CHROME_INDICATORS.remove(indicator)
+            cls._indicator_set = None
             return True
         return False
 
@@ -4,24 +4,132 @@ Human Behavior Module
 Provides human-like behaviors for web scrapers to avoid bot detection.
 """
 
+import asyncio
 import time
 import random
-from typing import Dict, Any, Optional
-from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.chrome.options import Options
 from fake_useragent import UserAgent
 
 
+@lru_cache(maxsize=1)
+def get_user_agent() -> UserAgent:
+    """
+    Get the process-wide user agent generator.
+
+    Loading fake_useragent's data is slow, so it is done once on first use
+    and shared by all instances.
+
+    Returns:
+        UserAgent: Shared user agent generator
+    """
+    return UserAgent()
+
+
+# Scrolls through a list of offsets from the starting position, pausing
+# pauses[i] seconds after each step, and reports the starting position.
+# Arguments: offsets, pauses, start (null to read window.pageYOffset)
+_SCROLL_STEPS_JS = """
+const offsets = arguments[0];
+const pauses = arguments[1];
+const done = arguments[arguments.length - 1];
+const start = arguments[2] === null ? window.pageYOffset : arguments[2];
+let i = 0;
+(function step() {
+    if (i >= offsets.length) {
+        done(start);
+        return;
+    }
+    window.scrollTo(0, Math.max(0, start + offsets[i]));
+    setTimeout(step, pauses[i++] * 1000);
+})();
+"""
+
+
+_READY_STATE_JS = "return document.readyState;"
+
+# Smoothly centers arguments[0] in the viewport
+_SCROLL_INTO_VIEW_JS = (
+    "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});"
+)
+
+# Chrome flags and preferences added by enhance_chrome_options
+_ANTI_DETECTION_FLAGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+    "--disable-features=VizDisplayCompositor",
+    "--disable-ipc-flooding-protection",
+)
+_ANTI_DETECTION_PREFS = {
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_settings.popups": 0,
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.media_stream": 2,
+}
+
+# Patches applied by remove_automation_flags
+_STEALTH_SCRIPTS = (
+    # Remove webdriver property
+    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})",
+    # Add human-like properties
+    "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})",
+    "Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']})",
+    "Object.defineProperty(navigator, 'permissions', {get: () => ({query: () => Promise.resolve({state: 'granted'})})})",
+    # Override permissions
+    "const originalQuery = window.navigator.permissions.query; window.navigator.permissions.query = (parameters) => (parameters.name === 'notifications' ? Promise.resolve({state: Notification.permission}) : originalQuery(parameters));",
+    # Add chrome runtime
+    "window.chrome = {runtime: {}}",
+    # Override iframe contentWindow
+    "Object.defineProperty(HTMLIFrameElement.prototype, 'contentWindow', {get: function() {return window;}})",
+)
+_STEALTH_JS = "\n".join(f"try {{ {script} }} catch (e) {{}}" for script in _STEALTH_SCRIPTS)
+
+
 class HumanBehavior:
     """Human-like behavior simulation for web scrapers."""
 
+    # User agent rotation, shared by all instances
+    user_agents = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/120.0.0.0",
+    )
+
+    # Window sizes for fingerprint randomization
+    window_sizes = (
+        (1366, 768),
+        (1920, 1080),
+        (1440, 900),
+        (1536, 864),
+        (1600, 900),
+        (1280, 720),
+        (1024, 768),
+        (1280, 1024),
+        (1600, 1200),
+    )
+
     def __init__(self, driver: Optional[webdriver.Chrome] = None):
         self.driver = driver
-        self.ua = UserAgent()
         self.session_start_time = datetime.now()
+        # Durations are measured on the monotonic clock, which is cheaper to
+        # read and unaffected by wall-clock adjustments
+        self._session_start = time.monotonic()
         self.actions_performed = 0
+        # Per-instance generator, so scrapers in different threads do not
+        # contend on the random module's shared generator
+        self._rng = random.Random()
 
         # Human-like behavior configuration
         self.config: Dict[str, Any] = {
@@ -31,34 +139,13 @@ class HumanBehavior:
             "scroll_pause_max": 0.5,  # Maximum pause during scrolling (reduced from 2.0)
             "mouse_movement": True,  # Enable mouse movement simulation
             "random_typing": True,  # Enable random typing delays
+            "type_chunk_size": 1,  # Characters sent per send_keys call when typing
+            "max_per_char_typing_len": 32,  # Longer text is typed in chunks of 4
             "session_rotation": True,  # Enable session rotation
             "proxy_rotation": False,  # Enable proxy rotation (if configured)
             "fingerprint_randomization": True,  # Enable browser fingerprint randomization
         }
 
-        # User agent rotation
-        self.user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/120.0.0.0",
-        ]
-
-        # Window sizes for fingerprint randomization
-        self.window_sizes = [
-            (1366, 768),
-            (1920, 1080),
-            (1440, 900),
-            (1536, 864),
-            (1600, 900),
-            (1280, 720),
-            (1024, 768),
-            (1280, 1024),
-            (1600, 1200),
-        ]
-
     def set_driver(self, driver: webdriver.Chrome):
         """Set the WebDriver instance."""
         self.driver = driver
@@ -67,6 +154,18 @@ class HumanBehavior:
         self, min_delay: Optional[float] = None, max_delay: Optional[float] = None
     ):
         """Add human-like random delay between actions."""
+        time.sleep(self._next_delay(min_delay, max_delay))
+
+    async def arandom_delay(
+        self, min_delay: Optional[float] = None, max_delay: Optional[float] = None
+    ):
+        """Async random_delay; other coroutines keep running during the pause."""
+        await asyncio.sleep(self._next_delay(min_delay, max_delay))
+
+    def _next_delay(
+        self, min_delay: Optional[float] = None, max_delay: Optional[float] = None
+    ) -> float:
+        """Pick the next action delay and count the action."""
         if min_delay is None:
             min_delay = self.config["min_delay"]
         if max_delay is None:
@@ -74,92 +173,146 @@ class HumanBehavior:
 
         # Type checker: we know these are now float values
         assert min_delay is not None and max_delay is not None
-        delay = random.uniform(min_delay, max_delay)
-        time.sleep(delay)
         self.actions_performed += 1
+        return self._rng.uniform(min_delay, max_delay)
 
     def human_scroll(self, direction: str = "down", distance: Optional[int] = None):
         """Perform human-like scrolling with variable speed and pauses."""
         if not self.driver:
             return
 
-        if distance is None:
-            distance = random.randint(300, 800)
+        # Steps run in the browser, one round trip per run of steps; only
+        # the longer reading pauses happen between calls
+        start = None
+        for offsets, pauses, reading_pause in self._plan_human_scroll(
+            direction, distance
+        ):
+            start = self._run_scroll_steps(offsets, pauses, start)
+            if reading_pause:
+                time.sleep(reading_pause)
 
-        # Get current scroll position
-        current_position = self.driver.execute_script("return window.pageYOffset;")
+        # Post-scroll pause
+        self.random_delay(0.5, 1.5)
 
-        if direction == "down":
-            target_position = current_position + distance
-        else:
-            target_position = max(0, current_position - distance)
+    async def ahuman_scroll(
+        self, direction: str = "down", distance: Optional[int] = None
+    ):
+        """Async human_scroll; pauses no longer block the event loop."""
+        if not self.driver:
+            return
+
+        start = None
+        for offsets, pauses, reading_pause in self._plan_human_scroll(
+            direction, distance
+        ):
+            start = await asyncio.to_thread(
+                self._run_scroll_steps, offsets, pauses, start
+            )
+            if reading_pause:
+                await asyncio.sleep(reading_pause)
+
+        # Post-scroll pause
+        await self.arandom_delay(0.5, 1.5)
+
+    def _plan_human_scroll(
+        self, direction: str, distance: Optional[int]
+    ) -> List[Tuple[List[int], List[float], float]]:
+        """Plan a human-like scroll as runs of steps split by reading pauses.
+
+        Returns:
+            List of (offsets, pauses, reading_pause) runs; offsets are relative
+            to the starting position and the last run ends at the target
+        """
+        if distance is None:
+            distance = self._rng.randint(300, 800)
+        sign = 1 if direction == "down" else -1
 
         # Scroll in small increments with random pauses
-        steps = random.randint(5, 15)
+        steps = self._rng.randint(5, 15)
         step_size = distance // steps
 
-        for i in range(steps):
-            if direction == "down":
-                new_position = current_position + (i + 1) * step_size
-            else:
-                new_position = max(0, current_position - (i + 1) * step_size)
+        pause_min = self.config["scroll_pause_min"]
+        pause_max = self.config["scroll_pause_max"]
 
-            # Smooth scroll with easing
-            self.driver.execute_script(f"window.scrollTo(0, {new_position});")
+        runs: List[Tuple[List[int], List[float], float]] = []
+        offsets: List[int] = []
+        pauses: List[float] = []
+        for i in range(steps):
+            offsets.append(sign * (i + 1) * step_size)
 
             # Random pause between scroll steps
-            pause = random.uniform(
-                self.config["scroll_pause_min"], self.config["scroll_pause_max"]
-            )
-            time.sleep(pause)
+            pauses.append(self._rng.uniform(pause_min, pause_max))
 
             # Occasionally add longer pause (like human reading)
-            if random.random() < 0.1:  # 10% chance
-                time.sleep(random.uniform(1.0, 3.0))
+            if self._rng.random() < 0.1:  # 10% chance
+                runs.append((offsets, pauses, self._rng.uniform(1.0, 3.0)))
+                offsets, pauses = [], []
 
         # Final scroll to exact position
-        self.driver.execute_script(f"window.scrollTo(0, {target_position});")
-
-        # Post-scroll pause
-        self.random_delay(0.5, 1.5)
+        offsets.append(sign * distance)
+        pauses.append(0)
+        runs.append((offsets, pauses, 0))
+        return runs
 
     def fast_scroll(self, direction: str = "down", distance: Optional[int] = None):
         """Perform fast scrolling with minimal delays for speed optimization."""
         if not self.driver:
             return
 
-        if distance is None:
-            distance = random.randint(400, 1000)  # Larger steps for faster scrolling
+        self._run_scroll_steps(*self._plan_fast_scroll(direction, distance))
 
-        # Get current scroll position
-        current_position = self.driver.execute_script("return window.pageYOffset;")
+    async def afast_scroll(
+        self, direction: str = "down", distance: Optional[int] = None
+    ):
+        """Async fast_scroll; the browser-side pauses run off the event loop."""
+        if not self.driver:
+            return
 
-        if direction == "down":
-            target_position = current_position + distance
-        else:
-            target_position = max(0, current_position - distance)
+        await asyncio.to_thread(
+            self._run_scroll_steps, *self._plan_fast_scroll(direction, distance)
+        )
+
+    def _plan_fast_scroll(
+        self, direction: str, distance: Optional[int]
+    ) -> Tuple[List[int], List[float]]:
+        """Plan a fast scroll as one run of offsets and pauses."""
+        if distance is None:
+            distance = self._rng.randint(400, 1000)  # Larger steps for faster scrolling
+        sign = 1 if direction == "down" else -1
 
         # Fast scroll with minimal steps and delays
-        steps = random.randint(2, 5)  # Fewer steps for faster scrolling
+        steps = self._rng.randint(2, 5)  # Fewer steps for faster scrolling
         step_size = distance // steps
 
-        for i in range(steps):
-            if direction == "down":
-                new_position = current_position + (i + 1) * step_size
-            else:
-                new_position = max(0, current_position - (i + 1) * step_size)
-
-            # Direct scroll without easing
-            self.driver.execute_script(f"window.scrollTo(0, {new_position});")
-
-            # Minimal pause between scroll steps
-            time.sleep(0.05)  # Very short delay
-
-        # Final scroll to exact position
-        self.driver.execute_script(f"window.scrollTo(0, {target_position});")
-
-        # Minimal post-scroll pause
-        time.sleep(0.1)
+        # Direct scroll without easing, with a very short delay between steps
+        # and a minimal post-scroll pause, all in one round trip
+        offsets = [sign * (i + 1) * step_size for i in range(steps)]
+        pauses = [0.05] * steps
+        offsets.append(sign * distance)
+        pauses.append(0.1)
+        return offsets, pauses
+
+    def _run_scroll_steps(
+        self,
+        offsets: List[int],
+        pauses: List[float],
+        start: Optional[int] = None,
+    ) -> Optional[int]:
+        """Scroll through offsets in the browser with one WebDriver call.
+
+        Args:
+            offsets: Positions relative to start, clamped at the top of the page
+            pauses: Seconds to wait after each step
+            start: Starting position; None reads the current scroll position
+
+        Returns:
+            The starting position, for continuing the same scroll
+        """
+        if not offsets:
+            return start
+        return self.driver.execute_async_script(
+            _SCROLL_STEPS_JS, offsets, pauses, start
+        )
 
     def simulate_mouse_movement(self, element=None):
         """Simulate human-like mouse movement."""
@@ -167,27 +320,37 @@ class HumanBehavior:
             return
 
         try:
-            actions = ActionChains(self.driver)
-
-            if element:
-                # Move to specific element
-                actions.move_to_element(element)
-            else:
-                # Random mouse movement
-                x = random.randint(100, 800)
-                y = random.randint(100, 600)
-                actions.move_by_offset(x, y)
-
-            # Add some random mouse movements
-            for _ in range(random.randint(1, 3)):
-                actions.move_by_offset(random.randint(-50, 50), random.randint(-50, 50))
-
-            actions.perform()
+            self._mouse_movement_chain(element).perform()
 
         except Exception:
             # Silently fail for mouse movement simulation
             pass
 
+    def _mouse_movement_chain(self, element=None) -> ActionChains:
+        """Queue human-like mouse movement on a new action chain.
+
+        Callers can append further actions (such as a click) so everything is
+        sent to the driver in one perform() call.
+        """
+        actions = ActionChains(self.driver)
+
+        # Some random jitter, summed into a single pointer move
+        randint = self._rng.randint
+        jitter = range(randint(1, 3))
+        dx = sum(randint(-50, 50) for _ in jitter)
+        dy = sum(randint(-50, 50) for _ in jitter)
+
+        if element:
+            # Move near the specific element (offsets are from its center)
+            actions.move_to_element_with_offset(element, dx, dy)
+        else:
+            # Random mouse movement
+            x = randint(100, 800)
+            y = randint(100, 600)
+            actions.move_by_offset(x + dx, y + dy)
+
+        return actions
+
     def human_type(self, element, text: str):
         """Simulate human-like typing with random delays."""
         if not self.config["random_typing"]:
@@ -198,24 +361,65 @@ class HumanBehavior:
         element.clear()
         self.random_delay(0.1, 0.3)
 
-        # Type character by character with random delays
-        for char in text:
-            element.send_keys(char)
-            # Random delay between characters (like human typing)
-            delay = random.uniform(0.05, 0.15)
+        # Type chunk by chunk with random delays
+        for chunk, delay in self._typing_chunks(text):
+            element.send_keys(chunk)
             time.sleep(delay)
 
-            # Occasionally add longer pause (like human thinking)
-            if random.random() < 0.05:  # 5% chance
-                time.sleep(random.uniform(0.2, 0.5))
+    async def ahuman_type(self, element, text: str):
+        """Async human_type; keystroke pauses no longer block the event loop."""
+        if not self.config["random_typing"]:
+            await asyncio.to_thread(element.send_keys, text)
+            return
+
+        # Clear field first
+        await asyncio.to_thread(element.clear)
+        await self.arandom_delay(0.1, 0.3)
+
+        # Type chunk by chunk with random delays
+        for chunk, delay in self._typing_chunks(text):
+            await asyncio.to_thread(element.send_keys, chunk)
+            await asyncio.sleep(delay)
+
+    def _typing_chunks(self, text: str) -> List[Tuple[str, float]]:
+        """Split text into send_keys chunks, each with the pause that follows it.
+
+        Every send_keys call is a WebDriver round trip, so long text is sent a
+        few characters at a time. A chunk waits as long as its characters
+        would have one by one, keeping the overall typing speed.
+        """
+        size = self.config["type_chunk_size"]
+        if len(text) > self.config["max_per_char_typing_len"]:
+            size = max(size, 4)
+
+        delays = self._typing_delays(len(text))
+        return [
+            (text[i : i + size], sum(delays[i : i + size]))
+            for i in range(0, len(text), size)
+        ]
+
+    def _typing_delays(self, count: int) -> List[float]:
+        """Sample the pause after each of count typed characters up front."""
+        uniform = self._rng.uniform
+        chance = self._rng.random
+        return [
+            # Random delay between characters (like human typing), plus an
+            # occasional longer pause (like human thinking, 5% chance)
+            uniform(0.05, 0.15) + (uniform(0.2, 0.5) if chance() < 0.05 else 0.0)
+            for _ in range(count)
+        ]
 
     def get_random_user_agent(self) -> str:
         """Get a random user agent string."""
-        return random.choice(self.user_agents)
+        return self._rng.choice(self.user_agents)
 
     def get_random_window_size(self) -> tuple:
         """Get a random window size for fingerprint randomization."""
-        return random.choice(self.window_sizes)
+        return self._rng.choice(self.window_sizes)
+
+    def get_random_window_sizes(self, count: int) -> List[Tuple[int, int]]:
+        """Get count random window sizes in one draw, e.g. to provision many browsers."""
+        return self._rng.choices(self.window_sizes, k=count)
 
     def enhance_chrome_options(self, chrome_options: Options):
         """Enhance Chrome options with anti-detection features."""
@@ -223,13 +427,8 @@ class HumanBehavior:
             return
 
         # Enhanced anti-detection Chrome options
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--allow-running-insecure-content")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_argument("--disable-ipc-flooding-protection")
+        for flag in _ANTI_DETECTION_FLAGS:
+            chrome_options.add_argument(flag)
 
         # Random window size
         window_size = self.get_random_window_size()
@@ -239,14 +438,9 @@ class HumanBehavior:
         user_agent = self.get_random_user_agent()
         chrome_options.add_argument(f"--user-agent={user_agent}")
 
-        # Additional preferences to mask automation
-        prefs = {
-            "profile.default_content_setting_values.notifications": 2,
-            "profile.default_content_settings.popups": 0,
-            "profile.managed_default_content_settings.images": 2,
-            "profile.default_content_setting_values.media_stream": 2,
-        }
-        chrome_options.add_experimental_option("prefs", prefs)
+        # Additional preferences to mask automation; copied because Options
+        # keeps the dict and callers may add their own preferences to it
+        chrome_options.add_experimental_option("prefs", dict(_ANTI_DETECTION_PREFS))
 
         # Remove automation flags
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
@@ -257,27 +451,13 @@ class HumanBehavior:
         if not self.driver:
             return
 
-        scripts = [
-            # Remove webdriver property
-            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})",
-            # Add human-like properties
-            "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})",
-            "Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']})",
-            "Object.defineProperty(navigator, 'permissions', {get: () => ({query: () => Promise.resolve({state: 'granted'})})})",
-            # Override permissions
-            "const originalQuery = window.navigator.permissions.query; window.navigator.permissions.query = (parameters) => (parameters.name === 'notifications' ? Promise.resolve({state: Notification.permission}) : originalQuery(parameters));",
-            # Add chrome runtime
-            "window.chrome = {runtime: {}}",
-            # Override iframe contentWindow
-            "Object.defineProperty(HTMLIFrameElement.prototype, 'contentWindow', {get: function() {return window;}})",
-        ]
-
-        for script in scripts:
-            try:
-                self.driver.execute_script(script)
-            except Exception:
-                # Silently fail for script execution
-                pass
+        # All patches in one round trip; each is isolated so a failing one
+        # does not stop the rest
+        try:
+            self.driver.execute_script(_STEALTH_JS)
+        except Exception:
+            # Silently fail for script execution
+            pass
 
     def human_click(self, element, scroll_to_element: bool = True):
         """Perform human-like click with mouse movement and delays."""
@@ -287,20 +467,22 @@ class HumanBehavior:
         try:
             # Scroll to element if requested
             if scroll_to_element:
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});",
-                    element,
-                )
+                self.driver.execute_script(_SCROLL_INTO_VIEW_JS, element)
                 self.random_delay(0.5, 1.0)
 
-            # Simulate mouse movement
-            self.simulate_mouse_movement(element)
-
-            # Small delay before clicking
-            self.random_delay(0.2, 0.5)
+            if self.config["mouse_movement"]:
+                # Mouse movement, the short pause and the click go to the
+                # driver as one action sequence
+                actions = self._mouse_movement_chain(element)
+                actions.pause(self._next_delay(0.2, 0.5))
+                actions.click(element)
+                actions.perform()
+            else:
+                # Small delay before clicking
+                self.random_delay(0.2, 0.5)
 
-            # Click the element
-            element.click()
+                # Click the element
+                element.click()
 
         except Exception:
             # Fallback to direct click
@@ -313,17 +495,15 @@ class HumanBehavior:
 
         try:
             # Scroll to element
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});",
-                element,
-            )
+            self.driver.execute_script(_SCROLL_INTO_VIEW_JS, element)
             self.random_delay(0.5, 1.0)
 
-            # Simulate mouse movement
-            self.simulate_mouse_movement(element)
-
-            # Click to focus
-            element.click()
+            # Click to focus, after simulated mouse movement in the same
+            # action sequence
+            if self.config["mouse_movement"]:
+                self._mouse_movement_chain(element).click(element).perform()
+            else:
+                element.click()
             self.random_delay(0.2, 0.5)
 
             # Fill with human-like typing
@@ -348,7 +528,32 @@ class HumanBehavior:
 
             # Refresh page
             self.driver.refresh()
-            self.random_delay(2, 4)
+            self._wait_for_page_load()
+            self.random_delay(0.3, 1.0)
+
+        except Exception:
+            # Silently fail for session rotation
+            pass
+
+    async def arotate_session(self):
+        """Async rotate_session; the refresh pause no longer blocks the event loop."""
+        if not self.config["session_rotation"] or not self.driver:
+            return
+
+        try:
+            # Clear cookies and cache
+            await asyncio.to_thread(self.driver.delete_all_cookies)
+            await asyncio.to_thread(
+                self.driver.execute_script, "window.localStorage.clear();"
+            )
+            await asyncio.to_thread(
+                self.driver.execute_script, "window.sessionStorage.clear();"
+            )
+
+            # Refresh page
+            await asyncio.to_thread(self.driver.refresh)
+            await asyncio.to_thread(self._wait_for_page_load)
+            await self.arandom_delay(0.3, 1.0)
 
         except Exception:
             # Silently fail for session rotation
@@ -366,8 +571,9 @@ class HumanBehavior:
             # Navigate to URL
             self.driver.get(url)
 
-            # Wait for page to load
-            self.random_delay(2, 4)
+            # Wait for page to load, plus a little jitter
+            self._wait_for_page_load()
+            self.random_delay(0.3, 1.0)
 
             # Simulate reading behavior
             self.random_delay(1, 2)
@@ -376,18 +582,60 @@ class HumanBehavior:
             # Fallback to direct navigation
             self.driver.get(url)
 
+    async def anatural_page_navigation(self, url: str):
+        """Async natural_page_navigation; other sessions run during its pauses.
+
+        Driver calls run in a worker thread and pauses use asyncio.sleep, so
+        several scrapers sharing an event loop overlap their waits instead of
+        serializing on time.sleep.
+        """
+        if not self.driver:
+            return
+
+        try:
+            # Random delay before navigation
+            await self.arandom_delay(1, 3)
+
+            # Navigate to URL
+            await asyncio.to_thread(self.driver.get, url)
+
+            # Wait for page to load, plus a little jitter
+            await asyncio.to_thread(self._wait_for_page_load)
+            await self.arandom_delay(0.3, 1.0)
+
+            # Simulate reading behavior
+            await self.arandom_delay(1, 2)
+
+        except Exception:
+            # Fallback to direct navigation
+            await asyncio.to_thread(self.driver.get, url)
+
+    def _wait_for_page_load(self, timeout: float = 10):
+        """Wait until document.readyState is complete, or give up after timeout.
+
+        Replaces a fixed post-navigation sleep, so fast pages are not padded
+        to a worst-case load time. A timeout is not an error; the caller
+        carries on with whatever has loaded.
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
+                lambda driver: driver.execute_script(_READY_STATE_JS) == "complete"
+            )
+        except TimeoutException:
+            pass
+
     def get_session_stats(self) -> Dict[str, Any]:
         """Get human-like behavior statistics."""
         if not self.session_start_time:
             return {}
 
-        session_duration = datetime.now() - self.session_start_time
+        duration = time.monotonic() - self._session_start
 
         return {
-            "session_duration": str(session_duration),
+            "session_duration": str(timedelta(seconds=duration)),
+            "session_duration_s": duration,
             "actions_performed": self.actions_performed,
-            "actions_per_minute": self.actions_performed
-            / max(session_duration.total_seconds() / 60, 1),
+            "actions_per_minute": self.actions_performed / max(duration / 60, 1),
             "human_config": self.config,
         }
 
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Screenshot Writer Module
+
+Writes captured screenshots to disk from a background thread so the scraping
+loop never waits on file I/O.
+"""
+
+import base64
+import logging
+import queue
+import threading
+from typing import List, Optional, Tuple, Union
+
+# Buffer size for each file write, larger than a typical post screenshot
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+class ScreenshotWriter:
+    """Background writer that drains screenshot bytes to disk in batches.
+
+    Producers hand over ``(filepath, data)`` pairs through a bounded queue,
+    where ``data`` is either image bytes or a base64 string as returned by
+    WebDriver, decoded on the writer thread. A
+    single consumer thread drains up to ``batch_size`` pending items at a time
+    and writes them with a large buffer. When the queue is full, ``submit``
+    blocks, so a slow disk throttles the scraper instead of letting encoded
+    screenshots pile up in memory.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = 64,
+        batch_size: int = 16,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """Initialize the writer and start its consumer thread.
+
+        Args:
+            max_pending: Maximum number of screenshots waiting to be written.
+            batch_size: Maximum number of screenshots written per drain.
+            logger: Optional logger instance. If None, uses the module logger.
+        """
+        self.batch_size = batch_size
+        self.logger = logger or logging.getLogger(__name__)
+        self._queue: "queue.Queue[Optional[Tuple[str, Union[bytes, str]]]]" = queue.Queue(
+            maxsize=max_pending
+        )
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="ScreenshotWriter", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, filepath: str, data: Union[bytes, str]) -> None:
+        """Queue a screenshot for writing, blocking while the queue is full.
+
+        Args:
+            filepath: Destination path of the screenshot file.
+            data: Encoded image bytes, or the same bytes as a base64 string.
+        """
+        if self._closed:
+            raise RuntimeError("ScreenshotWriter is closed")
+        self._queue.put((filepath, data))
+
+    def flush(self) -> None:
+        """Block until every queued screenshot has been written."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write any pending screenshots and stop the consumer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Consumer loop: drain the queue in batches until the stop sentinel."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = self._write_batch(batch)
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(
+        self, batch: List[Optional[Tuple[str, Union[bytes, str]]]]
+    ) -> bool:
+        """Write one batch of screenshots.
+
+        Args:
+            batch: Queued items; ``None`` is the stop sentinel.
+
+        Returns:
+            bool: True if the stop sentinel was part of the batch.
+        """
+        stop = False
+        for item in batch:
+            if item is None:
+                stop = True
+                continue
+
+            filepath, data = item
+            try:
+                if isinstance(data, str):
+                    data = base64.b64decode(data)
+                with open(filepath, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                    f.write(data)
+            except (OSError, ValueError) as e:
+                self.logger.error(f"Failed to write screenshot {filepath}: {str(e)}")
+
+        return stop